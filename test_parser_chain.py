@@ -13,13 +13,19 @@ import sys
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent to path for import
 sys.path.insert(0, str(Path(__file__).parent))
-from parser_chain import ParserChain, _meta
+from parser_chain import ParserChain, _meta, _parse_regex_combined
 
 # ── Sample CLI outputs ─────────────────────────────────────────────
+# bytes, as delivered by the SSH channel — ParserChain decodes once.
 
-SAMPLE_SHOW_IP_INTF_BRIEF = """
+SAMPLE_SHOW_IP_INTF_BRIEF = b"""
 Interface                  IP-Address      OK? Method Status                Protocol
 FastEthernet0/0            unassigned      YES NVRAM  administratively down down
 Ethernet1/0                172.16.1.2      YES NVRAM  up                    up
@@ -34,7 +40,7 @@ Ethernet3/0                unassigned      YES NVRAM  administratively down down
 Ethernet3/1                unassigned      YES NVRAM  administratively down down
 """
 
-SAMPLE_SHOW_PROC_CPU = """
+SAMPLE_SHOW_PROC_CPU = b"""
 CPU utilization for five seconds: 1%/0%; one minute: 2%; five minutes: 1%
  PID Runtime(ms)     Invoked      uSecs   5Sec   1Min   5Min TTY Process
    1       23480      272893         86  0.00%  0.00%  0.00%   0 Chunk Manager
@@ -44,7 +50,7 @@ CPU utilization for five seconds: 1%/0%; one minute: 2%; five minutes: 1%
    6         320       27232         11  0.00%  0.00%  0.00%   0 Pool Manager
 """
 
-SAMPLE_SHOW_BGP_SUMMARY = """
+SAMPLE_SHOW_BGP_SUMMARY = b"""
 BGP router identifier 172.16.100.1, local AS number 65001
 BGP table version is 15, main routing table version 15
 10 network entries using 1440 bytes of memory
@@ -62,7 +68,7 @@ Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State
 10.0.0.1        4        65004       0       0        1    0    0 never    Idle
 """
 
-SAMPLE_SHOW_MEM = """
+SAMPLE_SHOW_MEM = b"""
 Processor Pool Total:  409190504 Used:  265844792 Free:  143345712
       lsmi Pool Total:    6295128 Used:    6294296 Free:        832
 """
@@ -77,6 +83,12 @@ CONFIG_INTERFACES = {
             "type": "textfsm",
             "templates": ["cisco_ios_show_ip_interface_brief.textfsm"]
         },
+        {
+            "type": "columns",
+            "header": "Interface",
+            "columns": ["intf", "ipaddr", None, None, "status", "proto"],
+            "merge_column": "status"
+        },
         {
             "type": "regex",
             "pattern": r"^(\S+)\s+([\d.]+|unassigned)\s+\w+\s+\w+\s+((?:administratively )?(?:up|down))\s+(up|down)\s*$",
@@ -105,6 +117,22 @@ CONFIG_CPU = {
     "normalize": {"five_sec": "five_sec_total", "one_min": "one_min", "five_min": "five_min"}
 }
 
+CONFIG_CPU_PROCESSES = {
+    "command": "show processes cpu sorted",
+    "interval": 30,
+    "parsers": [
+        {
+            "type": "ws_table",
+            "header_regex": r"^\s*PID\s+Runtime",
+            "columns": [
+                ["pid", "int"], ["runtime_ms", "int"], ["invoked", "int"],
+                ["usecs", "int"], ["five_sec", "percent"], ["one_min", "percent"],
+                ["five_min", "percent"], ["tty", "int"], "process",
+            ]
+        }
+    ]
+}
+
 CONFIG_BGP = {
     "command": "show ip bgp summary",
     "interval": 60,
@@ -113,6 +141,11 @@ CONFIG_BGP = {
             "type": "textfsm",
             "templates": ["cisco_ios_show_ip_bgp_summary.textfsm"]
         },
+        {
+            "type": "columns",
+            "header": "Neighbor",
+            "columns": ["neighbor", None, "remote_as", None, None, None, None, None, "updown", "state_pfx"]
+        },
         {
             "type": "regex",
             "pattern": r"^([\d.]+)\s+4\s+(\d+)\s+\d+\s+\d+\s+\d+\s+\d+\s+\d+\s+(\S+)\s+(\S+)\s*$",
@@ -186,8 +219,11 @@ def run_test(name, raw_output, config, schema=None):
     print(f"  Rows:     {len(rows)}")
 
     # Pretty-print the combined result (data + metadata)
-    output = {"_meta": meta, "data": rows}
-    print(f"\n{json.dumps(output, indent=2)}")
+    output = {"_meta": dict(meta), "data": rows}
+    if orjson:
+        print(f"\n{orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()}")
+    else:
+        print(f"\n{json.dumps(output, indent=2)}")
 
     return rows, meta
 
@@ -217,8 +253,33 @@ def main():
     assert rows[1]["ip_address"] == "172.16.1.2"
     assert rows[1]["status"] == "up"
     assert rows[0]["status"] == "administratively down"
+    assert rows[0]["protocol"] == "down"
+    assert meta["_parsed_by"] == "builtin"
     print("\n  ✓ Interface parsing validated")
 
+    # Test the configured chain when the built-in parser is disabled
+    rows, meta = run_test(
+        "INTERFACES — fast_path off, columns parser",
+        SAMPLE_SHOW_IP_INTF_BRIEF,
+        dict(CONFIG_INTERFACES, fast_path=False),
+    )
+    assert meta["_parsed_by"] == "columns"
+    assert len(rows) == 11, f"Expected 11 interfaces, got {len(rows)}"
+    assert rows[0]["status"] == "administratively down"
+    print("\n  ✓ Columns parser validated")
+
+    # Test regex fallback when the columns header is missing
+    headerless = SAMPLE_SHOW_IP_INTF_BRIEF.split(b"\n", 2)[2]
+    rows, meta = run_test(
+        "INTERFACES — headerless output falls back to regex",
+        headerless,
+        dict(CONFIG_INTERFACES, fast_path=False),
+    )
+    assert meta["_parsed_by"] == "regex"
+    assert len(rows) == 11, f"Expected 11 interfaces, got {len(rows)}"
+    assert rows[0]["status"] == "administratively down"
+    print("\n  ✓ Regex fallback validated")
+
     # Test CPU
     rows, meta = run_test(
         "CPU — show processes cpu sorted",
@@ -232,6 +293,19 @@ def main():
     assert rows[0]["one_min"] == 2.0
     print("\n  ✓ CPU parsing validated")
 
+    # Test CPU process table
+    rows, meta = run_test(
+        "CPU PROCESSES — whitespace table",
+        SAMPLE_SHOW_PROC_CPU,
+        CONFIG_CPU_PROCESSES,
+    )
+    assert meta["_parsed_by"] == "ws_table"
+    assert len(rows) == 5, f"Expected 5 processes, got {len(rows)}"
+    assert rows[0]["pid"] == 1
+    assert rows[0]["process"] == "Chunk Manager"
+    assert rows[3]["five_sec"] == 0.07
+    print("\n  ✓ CPU process table validated")
+
     # Test BGP
     rows, meta = run_test(
         "BGP — show ip bgp summary",
@@ -243,8 +317,59 @@ def main():
     assert rows[0]["neighbor"] == "172.16.1.1"
     assert rows[0]["remote_as"] == 65002
     assert rows[2]["neighbor"] == "10.0.0.1"
+    assert rows[2]["state_pfx"] == "Idle"
     print("\n  ✓ BGP parsing validated")
 
+    # Test several regex fallbacks matched in one pass
+    multi = dict(CONFIG_BGP, parsers=[
+        {
+            "type": "regex",
+            "pattern": r"^Peer:\s+([\d.]+)\+\d+\s+AS\s+(\d+)",
+            "flags": "MULTILINE",
+            "groups": {"neighbor": 1, "remote_as": 2}
+        },
+        CONFIG_BGP["parsers"][-1],
+    ])
+    rows, meta = run_test(
+        "BGP — multiple regex fallbacks, second pattern wins",
+        SAMPLE_SHOW_BGP_SUMMARY,
+        multi,
+        SCHEMA_BGP,
+    )
+    assert meta["_parsed_by"] == "regex"
+    assert len(rows) == 3, f"Expected 3 peers, got {len(rows)}"
+    assert rows[1]["neighbor"] == "172.16.128.2"
+    assert rows[1]["remote_as"] == 65003
+    print("\n  ✓ Combined regex fallback validated")
+
+    # A later pattern matching further left must not beat an earlier one
+    overlap = [
+        {"type": "regex", "pattern": r"(\d+) pkts"},
+        {"type": "regex", "pattern": r"(Rx): \d+ pkts"},
+    ]
+    rows, meta = run_test(
+        "OVERLAP — first configured regex wins",
+        "Rx: 10 pkts\n",
+        {"command": "show counters", "parsers": overlap},
+    )
+    assert rows == [{"field_1": "10"}], rows
+    winner, rows = _parse_regex_combined("Rx: 10 pkts\n", overlap)
+    assert (winner, rows) == (0, [{"field_1": "10"}]), (winner, rows)
+    print("\n  ✓ Overlapping regex fallbacks keep configured order")
+
+    # "^baz|bar$" anchors only one end of each branch, so it must not be
+    # matched line by line from the start
+    rows, meta = run_test(
+        "ALTERNATION — top-level | is not line-anchored",
+        "foo bar\n",
+        {"command": "show alt", "parsers": [
+            {"type": "regex", "pattern": r"^baz|(bar)$", "flags": "MULTILINE"},
+        ]},
+    )
+    assert meta["_parsed_by"] == "regex"
+    assert rows == [{"field_1": "bar"}], rows
+    print("\n  ✓ Top-level alternation scanned with finditer")
+
     # Test Memory
     rows, meta = run_test(
         "MEMORY — show processes memory sorted",
@@ -0,0 +1,88 @@
+"""
+Shared test setup.
+
+wirlwind.manager imports the app's theme and config packages, which are
+not part of this tree. When they can't be imported, minimal stand-ins
+are registered so the manager modules load under plain pytest.
+"""
+
+import importlib
+import os
+import sys
+import types
+from dataclasses import asdict, dataclass, field
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@dataclass
+class _Theme:
+    name: str = "default"
+    terminal_colors: dict = field(default_factory=dict)
+    border_color: str = "#333333"
+    font_family: str = "Monospace"
+    font_size: int = 12
+
+
+class _ThemeEngine:
+    def __init__(self):
+        self.current = _Theme()
+
+    def list_themes(self):
+        return [self.current.name]
+
+    def get_theme(self, name):
+        return self.current if name == self.current.name else None
+
+
+@dataclass
+class _AppSettings:
+    theme_name: str = "default"
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+def _stub_missing_packages():
+    try:
+        importlib.import_module("wirlwind.theme.engine")
+        importlib.import_module("wirlwind.config")
+        return
+    except ImportError:
+        pass
+
+    theme = types.ModuleType("wirlwind.theme")
+    engine = types.ModuleType("wirlwind.theme.engine")
+    engine.Theme = _Theme
+    engine.ThemeEngine = _ThemeEngine
+    theme.engine = engine
+
+    settings = _AppSettings()
+    config = types.ModuleType("wirlwind.config")
+    config.AppSettings = _AppSettings
+    config.get_settings = lambda: settings
+    config.save_settings = lambda *args, **kwargs: None
+
+    sys.modules.update({
+        "wirlwind.theme": theme,
+        "wirlwind.theme.engine": engine,
+        "wirlwind.config": config,
+    })
+
+
+_stub_missing_packages()
+
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The QApplication for widget tests (pytest-qt's fixture when installed)."""
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,48 @@
+"""
+Shared credential model: combos keep their selection when the names change.
+"""
+
+import pytest
+
+from wirlwind.manager import _cred_model
+from wirlwind.manager._widgets import CredentialCombo
+
+
+@pytest.fixture(autouse=True)
+def fresh_models(qapp, monkeypatch):
+    monkeypatch.setattr(_cred_model, "_models", {})
+    monkeypatch.setattr(_cred_model, "_attached", {})
+
+
+def test_new_combo_does_not_move_open_combo_to_neighbour():
+    c1 = CredentialCombo(["a", "b", "c"])
+    c1.select_credential("b")
+
+    c2 = CredentialCombo(["a", "c"])
+
+    assert c1.currentData() is None
+    assert c2.findData("b") == -1
+
+
+def test_open_combos_keep_surviving_credential():
+    c1 = CredentialCombo(["a", "b", "c"])
+    c1.select_credential("c")
+    c2 = CredentialCombo(["a", "b", "c"])
+    c2.select_credential("a")
+
+    c2.set_names(["new", "a", "c"])
+
+    assert c1.currentData() == "c"
+    assert c2.currentData() == "a"
+
+
+def test_open_combo_change_signal_held_during_update():
+    c1 = CredentialCombo(["a", "b", "c"])
+    c1.select_credential("b")
+    seen = []
+    c1.currentIndexChanged.connect(seen.append)
+
+    CredentialCombo(["a", "c"])
+
+    assert seen == []
+    assert c1.signalsBlocked() is False
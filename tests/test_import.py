@@ -0,0 +1,164 @@
+"""
+Session import: hostnames repeated within one import file.
+"""
+
+import json
+
+import pytest
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QDialogButtonBox, QMessageBox
+
+from wirlwind.manager.io import (
+    ImportDialog,
+    ImportTerminalTelemetryDialog,
+    SessionStore,
+    import_sessions,
+    import_sessions_csv,
+    import_terminal_telemetry,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SessionStore(tmp_path / "sessions.db")
+    yield store
+    store.close()
+
+
+def test_json_duplicate_in_file_merges(store, tmp_path):
+    path = tmp_path / "export.json"
+    path.write_text(json.dumps({
+        "folders": [],
+        "sessions": [
+            {"name": "old", "hostname": "10.0.0.1", "port": 22},
+            {"name": "new", "hostname": "10.0.0.1", "port": 2222},
+        ],
+    }))
+
+    assert import_sessions(store, path, merge=True) == (2, 0)
+
+    sessions = store.list_all_sessions()
+    assert [(s.name, s.hostname, s.port) for s in sessions] == [
+        ("new", "10.0.0.1", 2222)
+    ]
+
+
+def test_csv_duplicate_in_file_merges(store, tmp_path):
+    path = tmp_path / "sessions.csv"
+    path.write_text(
+        "name,hostname,port\n"
+        "old,10.0.0.1,22\n"
+        "new,10.0.0.1,2222\n"
+    )
+
+    assert import_sessions_csv(store, path, merge=True) == (0, 2, 0)
+
+    sessions = store.list_all_sessions()
+    assert [(s.name, s.hostname, s.port) for s in sessions] == [
+        ("new", "10.0.0.1", 2222)
+    ]
+
+
+def test_terminal_telemetry_duplicate_in_file_merges(store, tmp_path):
+    path = tmp_path / "sessions.yaml"
+    path.write_text(
+        "- folder_name: Lab\n"
+        "  sessions:\n"
+        "  - host: 10.0.0.1\n"
+        "    display_name: old\n"
+        "  - host: 10.0.0.1\n"
+        "    display_name: new\n"
+        "    port: 2222\n"
+    )
+
+    assert import_terminal_telemetry(store, path, merge=True) == (1, 2, 0)
+
+    sessions = store.list_all_sessions()
+    assert [(s.name, s.hostname, s.port) for s in sessions] == [
+        ("new", "10.0.0.1", 2222)
+    ]
+
+
+def test_duplicate_of_stored_session_updates_it(store, tmp_path):
+    path = tmp_path / "export.json"
+    path.write_text(json.dumps({
+        "folders": [],
+        "sessions": [{"name": "first", "hostname": "10.0.0.1"}],
+    }))
+    import_sessions(store, path, merge=True)
+
+    path.write_text(json.dumps({
+        "folders": [],
+        "sessions": [
+            {"name": "second", "hostname": "10.0.0.1"},
+            {"name": "third", "hostname": "10.0.0.1"},
+        ],
+    }))
+    assert import_sessions(store, path, merge=True) == (2, 0)
+
+    assert [s.name for s in store.list_all_sessions()] == ["third"]
+
+
+def test_duplicate_in_file_skipped_without_merge(store, tmp_path):
+    path = tmp_path / "sessions.csv"
+    path.write_text(
+        "name,hostname,port\n"
+        "old,10.0.0.1,22\n"
+        "new,10.0.0.1,2222\n"
+    )
+
+    assert import_sessions_csv(store, path, merge=False) == (0, 1, 1)
+
+    assert [s.name for s in store.list_all_sessions()] == ["old"]
+
+
+def _load(qapp, dialog, path):
+    dialog._load_preview(path)
+    QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+
+
+def test_failed_preview_keeps_previous_file(qapp, store, tmp_path, monkeypatch):
+    errors = []
+    monkeypatch.setattr(QMessageBox, "critical", lambda *args: errors.append(args))
+    good = tmp_path / "export.json"
+    good.write_text(json.dumps({
+        "folders": [],
+        "sessions": [{"name": "a", "hostname": "10.0.0.1"}],
+    }))
+    bad = tmp_path / "broken.json"
+    bad.write_text("{")
+
+    dialog = ImportDialog(store)
+    _load(qapp, dialog, good)
+    _load(qapp, dialog, bad)
+
+    assert len(errors) == 1
+    assert dialog._import_path == good
+    assert dialog._preview_model.rowCount() == 1
+    ok = dialog._button_box.button(QDialogButtonBox.StandardButton.Ok)
+    assert ok.isEnabled()
+
+
+def test_failed_tt_preview_keeps_previous_file(qapp, store, tmp_path, monkeypatch):
+    errors = []
+    monkeypatch.setattr(QMessageBox, "critical", lambda *args: errors.append(args))
+    good = tmp_path / "sessions.yaml"
+    good.write_text(
+        "- folder_name: Lab\n"
+        "  sessions:\n"
+        "  - host: 10.0.0.1\n"
+        "    display_name: a\n"
+    )
+    bad = tmp_path / "broken.yaml"
+    bad.write_text("folder_name: Lab\n")
+
+    dialog = ImportTerminalTelemetryDialog(store)
+    _load(qapp, dialog, good)
+    _load(qapp, dialog, bad)
+
+    assert len(errors) == 1
+    assert dialog._import_path == good
+    assert dialog._preview_tree.topLevelItemCount() == 1
+    ok = dialog._button_box.button(QDialogButtonBox.StandardButton.Ok)
+    assert ok.isEnabled()
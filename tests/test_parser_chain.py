@@ -0,0 +1,236 @@
+"""
+Parser chain: regex fallbacks, whitespace tables and the built-in fast path.
+"""
+
+import pytest
+
+from wirlwind_telemetry import parser_chain
+from wirlwind_telemetry.parser_chain import (
+    ParserChain,
+    _is_line_anchored,
+    _parse_columns,
+    _parse_regex,
+    _parse_regex_combined,
+    _parse_ws_table,
+    parse_ip_interface_brief,
+)
+
+SHOW_IP_INTF_BRIEF = """
+Interface                  IP-Address      OK? Method Status                Protocol
+FastEthernet0/0            unassigned      YES NVRAM  administratively down down
+Ethernet1/0                172.16.1.2      YES NVRAM  up                    up
+Ethernet1/1                172.16.100.1    YES NVRAM  up                    up
+"""
+
+SHOW_PROC_CPU = """
+CPU utilization for five seconds: 1%/0%; one minute: 2%; five minutes: 1%
+ PID Runtime(ms)     Invoked      uSecs   5Sec   1Min   5Min TTY Process
+   1       23480      272893         86  0.00%  0.00%  0.00%   0 Chunk Manager
+   5      105300     4831208         21  0.07%  0.01%  0.00%   0 Check heaps
+"""
+
+INTF_REGEX = {
+    "type": "regex",
+    "pattern": r"^(\S+)\s+(\S+)\s+\S+\s+\S+\s+(.+?)\s+(up|down)\s*$",
+    "flags": "MULTILINE",
+    "groups": {"intf": 1, "ipaddr": 2, "status": 3, "proto": 4},
+}
+
+
+@pytest.fixture
+def no_hyperscan(monkeypatch):
+    """Force the combined-alternation path instead of the Hyperscan prefilter."""
+    monkeypatch.setattr(parser_chain, "_HAS_HYPERSCAN", False)
+
+
+# ── Combined regex ─────────────────────────────────────────────────
+
+def test_combined_first_configured_pattern_wins_over_leftmost_match():
+    parsers = [
+        {"type": "regex", "pattern": r"(\d+) pkts"},
+        {"type": "regex", "pattern": r"(Rx): \d+ pkts"},
+    ]
+    assert _parse_regex_combined("Rx: 10 pkts\n", parsers) == (
+        0, [{"field_1": "10"}]
+    )
+
+
+def test_combined_later_pattern_wins_when_earlier_cannot_match():
+    parsers = [
+        {"type": "regex", "pattern": r"^Peer:\s+(\S+)", "flags": "MULTILINE"},
+        INTF_REGEX,
+    ]
+    winner, rows = _parse_regex_combined(SHOW_IP_INTF_BRIEF, parsers)
+    assert winner == 1
+    assert rows == _parse_regex(SHOW_IP_INTF_BRIEF, INTF_REGEX)[0]
+
+
+def test_combined_no_match():
+    parsers = [
+        {"type": "regex", "pattern": r"^Peer:"},
+        {"type": "regex", "pattern": r"^Neighbor:"},
+    ]
+    assert _parse_regex_combined("nothing here\n", parsers) == (-1, None)
+
+
+def test_chain_combined_path_keeps_configured_order(no_hyperscan):
+    config = {
+        "command": "show counters",
+        "parsers": [
+            {"type": "regex", "pattern": r"(\d+) pkts"},
+            {"type": "regex", "pattern": r"(Rx): \d+ pkts"},
+        ],
+    }
+    rows, meta = ParserChain().parse("Rx: 10 pkts\n", config)
+    assert meta["_parsed_by"] == "regex"
+    assert rows == [{"field_1": "10"}]
+
+
+# Shipped cisco_ios interfaces fallback: \s* before the description can
+# run across a newline when the pattern isn't matched line by line
+INTF_DESC_REGEX = {
+    "type": "regex",
+    "pattern": r"^(?P<port>\S+)\s+(?P<status>up|down|admin down|deleted)"
+               r"\s+(?P<protocol>up|down)\s*(?P<description>.*)$",
+    "flags": "MULTILINE",
+}
+
+SHOW_INTF_DESC = "Gi0/1 up up\nGi0/2 up up uplink\n"
+
+
+def test_combined_line_anchored_winner_matches_alone(no_hyperscan):
+    chain = ParserChain()
+    alone, _ = chain.parse(SHOW_INTF_DESC, {
+        "command": "show interfaces description",
+        "parsers": [INTF_DESC_REGEX],
+    })
+    combined, meta = chain.parse(SHOW_INTF_DESC, {
+        "command": "show interfaces description",
+        "parsers": [
+            {"type": "regex", "pattern": r"^Peer:\s+(\S+)", "flags": "MULTILINE"},
+            INTF_DESC_REGEX,
+        ],
+    })
+    assert meta["_parsed_by"] == "regex"
+    assert combined == alone
+    assert [row["port"] for row in combined] == ["Gi0/1", "Gi0/2"]
+    assert combined[1]["description"] == "uplink"
+
+
+# ── Line-anchored fast path ────────────────────────────────────────
+
+@pytest.mark.parametrize("pattern, flags, expected", [
+    (r"^(\S+)\s+(\S+)$", "MULTILINE", True),
+    (r"^(up|down)$", "MULTILINE", True),
+    (r"^[|]x$", "MULTILINE", True),
+    (r"^(\S+)\s+(\S+)$", "", False),
+    (r"^(\S+)$", "MULTILINE|DOTALL", False),
+    (r"^a\nb$", "MULTILINE", False),
+    (r"^baz|bar$", "MULTILINE", False),
+    (r"^(?:a)|(b)$", "MULTILINE", False),
+])
+def test_is_line_anchored(pattern, flags, expected):
+    assert _is_line_anchored(pattern, flags) is expected
+
+
+def test_top_level_alternation_matches_mid_line():
+    rows, reason = _parse_regex(
+        "foo bar\n", {"pattern": r"^baz|(bar)$", "flags": "MULTILINE"}
+    )
+    assert reason == ""
+    assert rows == [{"field_1": "bar"}]
+
+
+def test_line_anchored_matches_finditer():
+    # An empty group after the "$" matches nothing but stops the pattern
+    # ending in "$", so the copy goes through finditer()
+    anchored = _parse_regex(SHOW_IP_INTF_BRIEF, INTF_REGEX)[0]
+    scanned = _parse_regex(
+        SHOW_IP_INTF_BRIEF, dict(INTF_REGEX, pattern=INTF_REGEX["pattern"] + "()")
+    )[0]
+    assert _is_line_anchored(INTF_REGEX["pattern"], "MULTILINE")
+    assert anchored == scanned
+    assert anchored[0] == {
+        "intf": "FastEthernet0/0",
+        "ipaddr": "unassigned",
+        "status": "administratively down",
+        "proto": "down",
+    }
+
+
+# ── Whitespace tables ──────────────────────────────────────────────
+
+def test_columns_merges_extra_tokens():
+    rows, reason = _parse_columns(SHOW_IP_INTF_BRIEF, {
+        "columns": ["name", "ip_address", None, None, "status", "protocol"],
+        "header": "Interface",
+        "merge_column": "status",
+    })
+    assert reason == ""
+    assert len(rows) == 3
+    assert rows[0] == {
+        "name": "FastEthernet0/0",
+        "ip_address": "unassigned",
+        "status": "administratively down",
+        "protocol": "down",
+    }
+
+
+def test_columns_missing_header():
+    assert _parse_columns(SHOW_IP_INTF_BRIEF, {
+        "columns": ["name"], "header": "Neighbor",
+    }) == (None, "header 'Neighbor' not found")
+
+
+def test_ws_table_casts_and_keeps_free_text_tail():
+    rows, reason = _parse_ws_table(SHOW_PROC_CPU, {
+        "header_regex": r"^\s*PID\s+Runtime",
+        "columns": [
+            ["pid", "int"], ["runtime_ms", "int"], ["invoked", "int"],
+            ["usecs", "int"], ["five_sec", "percent"], ["one_min", "percent"],
+            ["five_min", "percent"], ["tty", "int"], "process",
+        ],
+    })
+    assert reason == ""
+    assert [row["pid"] for row in rows] == [1, 5]
+    assert rows[0]["process"] == "Chunk Manager"
+    assert rows[1]["five_sec"] == 0.07
+
+
+def test_ws_table_keeps_uncastable_values_as_strings():
+    rows, _ = _parse_ws_table("a b\n1 x\n", {"columns": [["n", "int"], ["v", "int"]]})
+    assert rows == [{"n": "a", "v": "b"}, {"n": 1, "v": "x"}]
+
+
+def test_ws_table_header_not_found():
+    assert _parse_ws_table(SHOW_PROC_CPU, {
+        "header_regex": r"^Neighbor", "columns": ["a"],
+    }) == (None, "header not found")
+
+
+# ── Built-in fast parser and bytes input ───────────────────────────
+
+def test_parse_ip_interface_brief():
+    rows = parse_ip_interface_brief(SHOW_IP_INTF_BRIEF)
+    assert rows == [
+        {"intf": "FastEthernet0/0", "ipaddr": "unassigned",
+         "status": "administratively down", "proto": "down"},
+        {"intf": "Ethernet1/0", "ipaddr": "172.16.1.2",
+         "status": "up", "proto": "up"},
+        {"intf": "Ethernet1/1", "ipaddr": "172.16.100.1",
+         "status": "up", "proto": "up"},
+    ]
+
+
+def test_parse_ip_interface_brief_rejects_other_output():
+    assert parse_ip_interface_brief("This is not CLI output\n") is None
+
+
+def test_bytes_input_matches_str_input():
+    config = {"command": "show ip interface brief", "parsers": [INTF_REGEX]}
+    chain = ParserChain()
+    from_bytes = chain.parse(SHOW_IP_INTF_BRIEF.encode(), config)
+    from_str = chain.parse(SHOW_IP_INTF_BRIEF, config)
+    assert from_bytes == from_str
+    assert from_bytes[1]["_parsed_by"] == "builtin"
+    assert len(from_bytes[0]) == 3
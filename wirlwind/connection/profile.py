@@ -6,8 +6,46 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
-import json
-import yaml
+import re
+
+# yaml and json are imported inside the (de)serializers that use them —
+# building and resolving profiles never touches either.
+
+_HAS_ORJSON = False
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    pass
+
+
+# Strings PyYAML always emits as plain scalars: identifier-like, and not
+# one of the words its resolver would read back as a bool or null.
+_YAML_PLAIN = re.compile(r"[A-Za-z_][A-Za-z0-9_./-]*")
+_YAML_RESERVED = frozenset({
+    'yes', 'no', 'true', 'false', 'on', 'off', 'null', 'y', 'n',
+})
+
+
+def _yaml_plain_scalar(value) -> Optional[str]:
+    """Render a scalar the way yaml.dump would, or None if not trivially known."""
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        text = repr(value)
+        return text if '.' in text and 'e' not in text else None
+    if (isinstance(value, str)
+            and _YAML_PLAIN.fullmatch(value)
+            and value.lower() not in _YAML_RESERVED):
+        return value
+    return None
 
 
 class AuthMethod(Enum):
@@ -21,13 +59,21 @@ class AuthMethod(Enum):
     
     def requires_interaction(self) -> bool:
         """Does this method potentially need user interaction?"""
-        return self in (
-            AuthMethod.AGENT,  # YubiKey touch
-            AuthMethod.KEYBOARD_INTERACTIVE,
-        )
+        return self in _INTERACTIVE_METHODS
+
+
+# Enum members can't hold a set of their own members, so this lives
+# at module level.
+_INTERACTIVE_METHODS = frozenset({
+    AuthMethod.AGENT,  # YubiKey touch
+    AuthMethod.KEYBOARD_INTERACTIVE,
+})
+
+# value → member, skipping EnumMeta.__call__ on the from_dict path
+_AUTH_METHOD_MAP = AuthMethod._value2member_map_
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthConfig:
     """Authentication configuration for a single method."""
     method: AuthMethod
@@ -51,25 +97,39 @@ class AuthConfig:
     # Behavior
     allow_agent_fallback: bool = False
     
+    # Serialized after 'method'. Never serialize: password, key_data,
+    # key_passphrase
+    _SERIALIZABLE_FIELDS = (
+        'username', 'key_path', 'cert_path', 'credential_ref',
+        'allow_agent_fallback',
+    )
+    
     def to_dict(self) -> dict:
         """Serialize, excluding secrets."""
-        d = {
-            'method': self.method.value,
-            'username': self.username,
-            'key_path': self.key_path,
-            'cert_path': self.cert_path,
-            'credential_ref': self.credential_ref,
-            'allow_agent_fallback': self.allow_agent_fallback,
-        }
-        # Never serialize: password, key_data, key_passphrase
-        return {k: v for k, v in d.items() if v is not None}
+        d = {'method': self.method.value}
+        d.update({
+            k: v for k in self._SERIALIZABLE_FIELDS
+            if (v := getattr(self, k)) is not None
+        })
+        return d
     
     @classmethod
     def from_dict(cls, data: dict) -> AuthConfig:
         """Deserialize from dict."""
-        data = data.copy()
-        data['method'] = AuthMethod(data['method'])
-        return cls(**data)
+        return cls(
+            # Direct value lookup; AuthMethod() only to raise on bad values
+            method=(_AUTH_METHOD_MAP.get(data['method'])
+                    or AuthMethod(data['method'])),
+            username=data['username'],
+            password=data.get('password'),
+            credential_ref=data.get('credential_ref'),
+            key_path=data.get('key_path'),
+            key_data=data.get('key_data'),
+            key_passphrase=data.get('key_passphrase'),
+            cert_path=data.get('cert_path'),
+            agent_socket=data.get('agent_socket'),
+            allow_agent_fallback=data.get('allow_agent_fallback', False),
+        )
     
     @classmethod
     def password_auth(
@@ -126,7 +186,7 @@ class AuthConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class JumpHostConfig:
     """Jump host / bastion configuration."""
     hostname: str
@@ -138,27 +198,32 @@ class JumpHostConfig:
     touch_prompt: str = "Touch your security key..."
     banner_timeout: float = 30.0
     
+    _SERIALIZABLE_FIELDS = (
+        'hostname', 'port', 'auth', 'requires_touch', 'touch_prompt',
+        'banner_timeout',
+    )
+    
     def to_dict(self) -> dict:
         """Serialize to dict."""
-        return {
-            'hostname': self.hostname,
-            'port': self.port,
-            'auth': self.auth.to_dict() if self.auth else None,
-            'requires_touch': self.requires_touch,
-            'touch_prompt': self.touch_prompt,
-            'banner_timeout': self.banner_timeout,
-        }
+        d = {k: getattr(self, k) for k in self._SERIALIZABLE_FIELDS}
+        d['auth'] = self.auth.to_dict() if self.auth else None
+        return d
     
     @classmethod
     def from_dict(cls, data: dict) -> JumpHostConfig:
         """Deserialize from dict."""
-        data = data.copy()
-        if data.get('auth'):
-            data['auth'] = AuthConfig.from_dict(data['auth'])
-        return cls(**data)
+        auth = data.get('auth')
+        return cls(
+            hostname=data['hostname'],
+            port=data.get('port', 22),
+            auth=AuthConfig.from_dict(auth) if auth else None,
+            requires_touch=data.get('requires_touch', False),
+            touch_prompt=data.get('touch_prompt', "Touch your security key..."),
+            banner_timeout=data.get('banner_timeout', 30.0),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionProfile:
     """
     Complete connection specification.
@@ -200,66 +265,101 @@ class ConnectionProfile:
     description: str = ""
     group: str = ""  # For UI grouping
     
+    # Memoized requires_interaction (profiles are treated as immutable
+    # once built — use clone() to derive a changed one)
+    _interaction_cache: Optional[bool] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    _SERIALIZABLE_FIELDS = (
+        'name', 'hostname', 'port', 'auth_methods', 'jump_hosts',
+        'term_type', 'term_cols', 'term_rows',
+        'keepalive_interval', 'keepalive_count_max', 'connect_timeout',
+        'auto_reconnect', 'reconnect_delay', 'reconnect_max_attempts',
+        'reconnect_backoff', 'match_patterns', 'tags', 'description', 'group',
+    )
+    
     def to_dict(self) -> dict:
         """Serialize to dict (for saving)."""
-        return {
-            'name': self.name,
-            'hostname': self.hostname,
-            'port': self.port,
-            'auth_methods': [a.to_dict() for a in self.auth_methods],
-            'jump_hosts': [j.to_dict() for j in self.jump_hosts],
-            'term_type': self.term_type,
-            'term_cols': self.term_cols,
-            'term_rows': self.term_rows,
-            'keepalive_interval': self.keepalive_interval,
-            'keepalive_count_max': self.keepalive_count_max,
-            'connect_timeout': self.connect_timeout,
-            'auto_reconnect': self.auto_reconnect,
-            'reconnect_delay': self.reconnect_delay,
-            'reconnect_max_attempts': self.reconnect_max_attempts,
-            'reconnect_backoff': self.reconnect_backoff,
-            'match_patterns': self.match_patterns,
-            'tags': self.tags,
-            'description': self.description,
-            'group': self.group,
-        }
+        d = {k: getattr(self, k) for k in self._SERIALIZABLE_FIELDS}
+        d['auth_methods'] = [a.to_dict() for a in self.auth_methods]
+        d['jump_hosts'] = [j.to_dict() for j in self.jump_hosts]
+        return d
     
     @classmethod
     def from_dict(cls, data: dict) -> ConnectionProfile:
         """Deserialize from dict."""
-        data = data.copy()
-        data['auth_methods'] = [
-            AuthConfig.from_dict(a) for a in data.get('auth_methods', [])
-        ]
-        data['jump_hosts'] = [
-            JumpHostConfig.from_dict(j) for j in data.get('jump_hosts', [])
-        ]
-        return cls(**data)
+        return cls(**{
+            **data,
+            'auth_methods': [
+                AuthConfig.from_dict(a) for a in data.get('auth_methods', [])
+            ],
+            'jump_hosts': [
+                JumpHostConfig.from_dict(j) for j in data.get('jump_hosts', [])
+            ],
+        })
     
     def to_yaml(self) -> str:
-        """Serialize to YAML string."""
-        return yaml.dump(self.to_dict(), default_flow_style=False, sort_keys=False)
+        """
+        Serialize to YAML string.
+        
+        Top-level keys are fixed, so simple scalars are written directly;
+        lists and anything needing quoting go through yaml.dump one key
+        at a time. Output is identical to dumping the whole dict.
+        """
+        import yaml
+        dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+        out = []
+        for key, value in self.to_dict().items():
+            text = None if isinstance(value, list) else _yaml_plain_scalar(value)
+            if text is None:
+                out.append(yaml.dump(
+                    {key: value},
+                    Dumper=dumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                ))
+            else:
+                out.append(f"{key}: {text}\n")
+        return ''.join(out)
     
     @classmethod
     def from_yaml(cls, yaml_str: str) -> ConnectionProfile:
         """Deserialize from YAML string."""
-        return cls.from_dict(yaml.safe_load(yaml_str))
+        import yaml
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        return cls.from_dict(yaml.load(yaml_str, Loader=loader))
     
     def to_json(self, indent: int = 2) -> str:
         """Serialize to JSON string."""
+        if _HAS_ORJSON and indent == 2:
+            return self._to_json_bytes().decode()
+        import json
         return json.dumps(self.to_dict(), indent=indent)
     
+    def _to_json_bytes(self) -> bytes:
+        """Serialize to indented UTF-8 JSON (orjson when available)."""
+        if _HAS_ORJSON:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        import json
+        return json.dumps(self.to_dict(), indent=2).encode()
+    
     @classmethod
     def from_json(cls, json_str: str) -> ConnectionProfile:
         """Deserialize from JSON string."""
+        if _HAS_ORJSON:
+            return cls.from_dict(orjson.loads(json_str))
+        import json
         return cls.from_dict(json.loads(json_str))
     
     def save(self, path: str) -> None:
         """Save to file (YAML or JSON based on extension)."""
         from pathlib import Path
         p = Path(path)
-        content = self.to_yaml() if p.suffix in ('.yaml', '.yml') else self.to_json()
-        p.write_text(content)
+        if p.suffix in ('.yaml', '.yml'):
+            p.write_text(self.to_yaml())
+        else:
+            p.write_bytes(self._to_json_bytes())
     
     @classmethod
     def load(cls, path: str) -> ConnectionProfile:
@@ -274,12 +374,17 @@ class ConnectionProfile:
     @property
     def requires_interaction(self) -> bool:
         """Does this connection require user interaction to establish?"""
+        if self._interaction_cache is None:
+            self._interaction_cache = self._compute_requires_interaction()
+        return self._interaction_cache
+    
+    def _compute_requires_interaction(self) -> bool:
         for jump in self.jump_hosts:
             if jump.requires_touch:
                 return True
-            if jump.auth and jump.auth.method.requires_interaction():
+            if jump.auth and jump.auth.method in _INTERACTIVE_METHODS:
                 return True
-        return any(a.method.requires_interaction() for a in self.auth_methods)
+        return any(a.method in _INTERACTIVE_METHODS for a in self.auth_methods)
     
     @property
     def display_name(self) -> str:
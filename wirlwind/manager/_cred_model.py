@@ -0,0 +1,167 @@
+"""
+Shared credential list model for the session dialogs.
+
+The connect, session editor and quick connect dialogs all offer the
+same vault credential names. One QStandardItemModel per sentinel layout
+is built on first use and handed to every combo. Its rows only change
+in update_credential_names(), which puts every attached combo back on
+the credential it had selected.
+"""
+
+from __future__ import annotations
+import weakref
+from typing import Dict, List, Tuple
+
+from PyQt6 import sip
+from PyQt6.QtWidgets import QComboBox
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
+from PyQt6.QtCore import Qt
+
+# Sentinel rows at the top of the session editor / quick connect combos
+SESSION_CRED_PREFIX = (("(SSH Agent)", None), ("(Ask on connect)", "__ask__"))
+
+# Sentinel row at the top of the connect dialog combo
+CONNECT_CRED_PREFIX = (("(none)", None),)
+
+# Past this many entries, stop sizing the combo to its widest item
+_LARGE_COMBO = 200
+
+# prefix_items -> (model, names currently loaded after the prefix rows)
+_models: Dict[tuple, Tuple[QStandardItemModel, List[str]]] = {}
+
+# prefix_items -> combos currently showing that model
+_attached: Dict[tuple, "weakref.WeakSet[QComboBox]"] = {}
+
+
+def _make_item(label: str, data) -> QStandardItem:
+    item = QStandardItem(label)
+    item.setData(data, Qt.ItemDataRole.UserRole)
+    item.setEditable(False)
+    return item
+
+
+def get_credential_model(
+    names: List[str],
+    prefix_items: tuple = SESSION_CRED_PREFIX,
+) -> QStandardItemModel:
+    """
+    Return the shared model for prefix_items, loaded with names.
+
+    The first len(prefix_items) rows are the sentinels; each following
+    row is a credential name with the name itself as its UserRole data.
+    """
+    update_credential_names(names, prefix_items)
+    return _models[tuple(prefix_items)][0]
+
+
+def update_credential_names(
+    names: List[str],
+    prefix_items: tuple = SESSION_CRED_PREFIX,
+) -> None:
+    """
+    Load names into the shared model for prefix_items.
+
+    Every combo attached to the model keeps its selected credential by
+    name. A combo whose credential was removed drops to the first
+    sentinel row rather than to whichever row took its place.
+    """
+    prefix_items = tuple(prefix_items)
+    names = list(names)
+    entry = _models.get(prefix_items)
+
+    if entry is None:
+        model = QStandardItemModel()
+        for label, data in prefix_items:
+            model.appendRow(_make_item(label, data))
+        _models[prefix_items] = (model, names)
+        _sync_rows(model, len(prefix_items), [], names)
+        return
+
+    model, loaded = entry
+    if loaded == names:
+        return
+
+    combos = [
+        c for c in _attached.get(prefix_items, ())
+        if not sip.isdeleted(c) and c.model() is model
+    ]
+    selected = [c.currentData() for c in combos]
+    blocked = [c.blockSignals(True) for c in combos]
+    try:
+        _sync_rows(model, len(prefix_items), loaded, names)
+        _models[prefix_items] = (model, names)
+        for combo, data in zip(combos, selected):
+            combo.setCurrentIndex(max(combo.findData(data), 0))
+    finally:
+        for combo, was_blocked in zip(combos, blocked):
+            combo.blockSignals(was_blocked)
+
+
+def _sync_rows(
+    model: QStandardItemModel,
+    start: int,
+    loaded: List[str],
+    names: List[str],
+) -> None:
+    """
+    Bring the name rows of model from loaded to names, touching only the delta.
+
+    Rows that survive keep their items, so views holding one as the
+    current index are not disturbed. If the survivors have changed
+    relative order the name rows are rebuilt instead.
+    """
+    wanted = set(names)
+    have = set(loaded)
+    survivors = [n for n in loaded if n in wanted]
+    if survivors != [n for n in names if n in have]:
+        model.removeRows(start, model.rowCount() - start)
+        for name in names:
+            model.appendRow(_make_item(name, name))
+        return
+
+    # Removals bottom-up so earlier row numbers stay valid
+    for i in range(len(loaded) - 1, -1, -1):
+        if loaded[i] not in wanted:
+            model.removeRow(start + i)
+
+    for i, name in enumerate(names):
+        if name not in have:
+            model.insertRow(start + i, _make_item(name, name))
+
+
+def attach_credential_model(
+    combo: QComboBox,
+    names: List[str],
+    prefix_items: tuple = SESSION_CRED_PREFIX,
+    select=None,
+) -> None:
+    """
+    Point combo at the shared credential model and restore a selection.
+
+    select is the data value to re-select after the swap; if it is no
+    longer in the list, the first sentinel row is selected.
+    Signals are held while the model changes so listeners see only the
+    settled selection.
+    """
+    combo.blockSignals(True)
+    try:
+        model = get_credential_model(names, prefix_items)
+        if combo.model() is not model:
+            combo.setModel(model)
+            combo.setModelColumn(0)
+            _attached.setdefault(tuple(prefix_items), weakref.WeakSet()).add(combo)
+
+        view = combo.view()
+        if hasattr(view, "setUniformItemSizes"):
+            view.setUniformItemSizes(True)
+        if len(names) > _LARGE_COMBO:
+            combo.setSizeAdjustPolicy(
+                QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+            )
+            combo.setMinimumContentsLength(24)
+
+        if select is not None:
+            # Fall back to the first sentinel if the name has gone away
+            combo.setCurrentIndex(max(combo.findData(select), 0))
+    finally:
+        combo.blockSignals(False)
@@ -0,0 +1,91 @@
+"""
+Lightweight tree model for the import dialog previews.
+
+Preview files can hold tens of thousands of sessions; a QTreeWidget
+allocates a widget item per row up front, while this model keeps plain
+Python nodes and lets the view ask only for the rows it paints.
+"""
+
+from __future__ import annotations
+from typing import Optional
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+
+class PreviewNode:
+    """One preview row: display text per column plus child rows."""
+
+    __slots__ = ("text", "parent", "children", "row")
+
+    def __init__(self, *text: str):
+        self.text = text
+        self.parent: Optional[PreviewNode] = None
+        self.children: list[PreviewNode] = []
+        self.row = 0
+
+    def add(self, child: PreviewNode) -> PreviewNode:
+        child.parent = self
+        child.row = len(self.children)
+        self.children.append(child)
+        return child
+
+
+class SessionPreviewModel(QAbstractItemModel):
+    """Read-only tree of PreviewNodes under fixed column headers."""
+
+    def __init__(self, headers: tuple[str, ...], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._root = PreviewNode()
+
+    def set_root(self, root: PreviewNode) -> None:
+        """Replace the whole tree in one model reset."""
+        self.beginResetModel()
+        self._root = root
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.set_root(PreviewNode())
+
+    def _node(self, index: QModelIndex) -> PreviewNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    # QAbstractItemModel interface
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self._node(parent).children[row])
+
+    def parent(self, index: QModelIndex = None):
+        if index is None:
+            return super().parent()  # QObject.parent()
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer().parent
+        if node is None or node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        text = index.internalPointer().text
+        column = index.column()
+        return text[column] if column < len(text) else None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole
+                and section < len(self._headers)):
+            return self._headers[section]
+        return None
@@ -0,0 +1,78 @@
+"""
+Small form widgets shared by the session dialogs.
+"""
+
+from __future__ import annotations
+from typing import List
+
+from PyQt6.QtWidgets import (
+    QWidget, QHBoxLayout, QLineEdit, QSpinBox, QComboBox, QLabel
+)
+
+from ._cred_model import SESSION_CRED_PREFIX, attach_credential_model
+
+
+class HostPortWidget(QWidget):
+    """Hostname field and port spinner on one row."""
+
+    def __init__(self, parent: QWidget = None):
+        super().__init__(parent)
+
+        row = QHBoxLayout(self)
+        row.setContentsMargins(0, 0, 0, 0)
+
+        self.host_input = QLineEdit()
+        self.host_input.setPlaceholderText("hostname or IP")
+        row.addWidget(self.host_input, 1)
+
+        row.addWidget(QLabel(":"))
+
+        self.port_input = QSpinBox()
+        self.port_input.setRange(1, 65535)
+        self.port_input.setValue(22)
+        self.port_input.setFixedWidth(80)
+        row.addWidget(self.port_input)
+
+        self.setFocusProxy(self.host_input)
+
+    def host(self) -> str:
+        return self.host_input.text().strip()
+
+    def port(self) -> int:
+        return self.port_input.value()
+
+    def set_host(self, host: str) -> None:
+        self.host_input.setText(host)
+
+    def set_port(self, port: int) -> None:
+        self.port_input.setValue(port)
+
+
+class CredentialCombo(QComboBox):
+    """
+    Vault credential picker backed by the shared credential model.
+
+    Item data is the credential name, None for SSH agent, or "__ask__"
+    for prompt-on-connect when include_ask is set.
+    """
+
+    def __init__(
+        self,
+        names: List[str] = None,
+        include_ask: bool = True,
+        parent: QWidget = None
+    ):
+        super().__init__(parent)
+        self._prefix = SESSION_CRED_PREFIX if include_ask else SESSION_CRED_PREFIX[:1]
+        attach_credential_model(self, names or [], self._prefix)
+
+    def set_names(self, names: List[str]) -> None:
+        """Update available credential names, keeping the selection."""
+        current = self.currentData()
+        attach_credential_model(self, names, self._prefix, select=current or None)
+
+    def select_credential(self, name: str) -> None:
+        """Select a credential by name if it is in the list."""
+        idx = self.findData(name)
+        if idx >= 0:
+            self.setCurrentIndex(idx)
@@ -2,6 +2,9 @@
 SSH Connection Dialog - Authentication configuration before connecting.
 """
 
+import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 from PyQt6.QtWidgets import (
@@ -9,11 +12,61 @@ from PyQt6.QtWidgets import (
     QLabel, QLineEdit, QPushButton, QComboBox, QCheckBox,
     QFileDialog, QTabWidget, QWidget, QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 
 from wirlwind.connection.profile import ConnectionProfile, AuthConfig, AuthMethod
 from wirlwind.vault.resolver import CredentialResolver
 from wirlwind.manager import SavedSession
+from wirlwind.manager._cred_model import (
+    CONNECT_CRED_PREFIX, attach_credential_model,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Resolved once at import, not per dialog
+_HOME = Path.home()
+_SSH_DIR = _HOME / ".ssh"
+_DEFAULT_KEY = _SSH_DIR / "id_rsa"
+_DEFAULT_USER = os.environ.get("USER") or os.environ.get("USERNAME") or "admin"
+
+
+@lru_cache(maxsize=1)
+def _key_browse_dir() -> str:
+    """Starting directory for the key file picker (stat'd once per process)."""
+    return str(_SSH_DIR) if _SSH_DIR.exists() else str(_HOME)
+
+
+def _check_key_file(path: str) -> tuple:
+    """Return (ok, reason) for a candidate private key path."""
+    p = Path(path).expanduser()
+    try:
+        if not p.is_file():
+            return False, "File not found"
+        with open(p, 'rb') as f:
+            head = f.read(64)
+    except OSError as e:
+        return False, str(e)
+    if b'PRIVATE KEY' not in head:
+        return False, "Not a PEM/OpenSSH private key"
+    return True, ""
+
+
+class _KeyValidatorSignals(QObject):
+    finished = pyqtSignal(str, bool, str)  # (path, ok, reason)
+
+
+class _KeyValidator(QRunnable):
+    """Checks a key file off the GUI thread (slow/network home dirs)."""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.signals = _KeyValidatorSignals()
+
+    def run(self):
+        ok, reason = _check_key_file(self.path)
+        self.signals.finished.emit(self.path, ok, reason)
 
 
 class ConnectDialog(QDialog):
@@ -38,6 +91,18 @@ class ConnectDialog(QDialog):
 
         self._profile: Optional[ConnectionProfile] = None
 
+        # name -> credential, fetched once (see refresh_credentials)
+        self._cred_cache: dict = {}
+        self._cred_error: Optional[str] = None
+        self._creds_loaded = False
+
+        # Last key path that validated OK, and the in-flight validator
+        self._key_ok_path: Optional[str] = None
+        self._key_validator: Optional[_KeyValidator] = None
+
+        # Built on first Browse and reused, native pickers are slow to create
+        self._key_file_dialog: Optional[QFileDialog] = None
+
         self.setWindowTitle(f"Connect to {session.name}")
         self.setMinimumWidth(450)
         self.setModal(True)
@@ -45,6 +110,11 @@ class ConnectDialog(QDialog):
         self._setup_ui()
         self._load_defaults()
 
+        # Vault reads can be slow (keyring, decrypt) — let the dialog
+        # paint first. Not a worker thread: the vault's sqlite
+        # connection belongs to the GUI thread.
+        QTimer.singleShot(0, self.refresh_credentials)
+
     def _setup_ui(self):
         """Build the dialog UI."""
         layout = QVBoxLayout(self)
@@ -69,15 +139,11 @@ class ConnectDialog(QDialog):
 
             form = QFormLayout()
             self._cred_combo = QComboBox()
-            self._cred_combo.addItem("(none)", None)
-            for name in self.credential_names:
-                self._cred_combo.addItem(name, name)
-
             # Pre-select if session has a credential
-            if self.session.credential_name:
-                idx = self._cred_combo.findData(self.session.credential_name)
-                if idx >= 0:
-                    self._cred_combo.setCurrentIndex(idx)
+            attach_credential_model(
+                self._cred_combo, self.credential_names, CONNECT_CRED_PREFIX,
+                select=self.session.credential_name,
+            )
 
             form.addRow("Credential:", self._cred_combo)
             cred_layout.addLayout(form)
@@ -120,8 +186,13 @@ class ConnectDialog(QDialog):
         key_path_layout = QHBoxLayout()
         self._key_path = QLineEdit()
         self._key_path.setPlaceholderText("~/.ssh/id_rsa")
+        self._key_path.editingFinished.connect(self._schedule_key_validation)
         key_path_layout.addWidget(self._key_path)
 
+        self._key_status = QLabel()
+        self._key_status.setFixedWidth(16)
+        key_path_layout.addWidget(self._key_status)
+
         browse_btn = QPushButton("Browse...")
         browse_btn.clicked.connect(self._browse_key)
         key_path_layout.addWidget(browse_btn)
@@ -174,18 +245,13 @@ class ConnectDialog(QDialog):
 
     def _load_defaults(self):
         """Load default values from session."""
-        import os
-        default_user = os.environ.get("USER", "admin")
-
         # Set defaults for all username fields
-        self._pw_username.setText(default_user)
-        self._key_username.setText(default_user)
-        self._agent_username.setText(default_user)
+        self._pw_username.setText(_DEFAULT_USER)
+        self._key_username.setText(_DEFAULT_USER)
+        self._agent_username.setText(_DEFAULT_USER)
 
-        # Default key path
-        default_key = Path.home() / ".ssh" / "id_rsa"
-        if default_key.exists():
-            self._key_path.setText(str(default_key))
+        # Default key path: left empty so the placeholder shows; an empty
+        # field means ~/.ssh/id_rsa and is checked only on Connect
 
         # If session has a credential, select the credential tab
         if self.session.credential_name and self.credential_names:
@@ -194,6 +260,25 @@ class ConnectDialog(QDialog):
             # Default to SSH Agent tab if no saved credential
             self._tabs.setCurrentIndex(self._tabs.count() - 1)
 
+    def refresh_credentials(self):
+        """
+        Re-read credentials from the resolver.
+
+        The dialog fetches once and serves combo changes from the cache;
+        call this after changing the vault while the dialog is open.
+        """
+        self._cred_cache = {}
+        self._cred_error = None
+        if self.credential_resolver:
+            try:
+                self._cred_cache = {
+                    c.name: c for c in self.credential_resolver.list_credentials()
+                }
+            except Exception as e:
+                self._cred_error = str(e)
+        self._creds_loaded = True
+        self._on_credential_changed()
+
     def _on_credential_changed(self):
         """Update credential info display."""
         if not hasattr(self, '_cred_combo'):
@@ -201,35 +286,69 @@ class ConnectDialog(QDialog):
 
         cred_name = self._cred_combo.currentData()
         if cred_name and self.credential_resolver:
-            try:
-                # Try to get credential info
-                creds = self.credential_resolver.list_credentials()
-                for cred in creds:
-                    if cred.name == cred_name:
-                        info_parts = [f"Username: {cred.username}"]
-                        if hasattr(cred, 'auth_type'):
-                            info_parts.append(f"Type: {cred.auth_type}")
-                        if hasattr(cred, 'has_key') and cred.has_key:
-                            info_parts.append("Has SSH key")
-                        self._cred_info.setText("\n".join(info_parts))
-                        return
-            except Exception as e:
-                self._cred_info.setText(f"Error loading credential: {e}")
+            if not self._creds_loaded:
+                self._cred_info.setText("Loading credential details...")
+                return
+            if self._cred_error:
+                self._cred_info.setText(
+                    f"Error loading credential: {self._cred_error}"
+                )
+                return
+
+            cred = self._cred_cache.get(cred_name)
+            if cred:
+                info_parts = [f"Username: {cred.username}"]
+                if hasattr(cred, 'auth_type'):
+                    info_parts.append(f"Type: {cred.auth_type}")
+                if hasattr(cred, 'has_key') and cred.has_key:
+                    info_parts.append("Has SSH key")
+                self._cred_info.setText("\n".join(info_parts))
                 return
 
         self._cred_info.setText("")
 
     def _browse_key(self):
         """Browse for SSH key file."""
-        ssh_dir = Path.home() / ".ssh"
-        path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select SSH Key",
-            str(ssh_dir) if ssh_dir.exists() else str(Path.home()),
-            "All Files (*)"
-        )
+        dlg = self._key_file_dialog
+        if dlg is None:
+            dlg = self._key_file_dialog = QFileDialog(self, "Select SSH Key")
+            dlg.setFileMode(QFileDialog.FileMode.ExistingFile)
+            dlg.setNameFilter("All Files (*)")
+        dlg.setDirectory(_key_browse_dir())
+
+        files = dlg.selectedFiles() if dlg.exec() else []
+        path = files[0] if files else ""
         if path:
             self._key_path.setText(path)
+            self._schedule_key_validation()
+
+    def _current_key_path(self) -> str:
+        return self._key_path.text().strip() or str(_DEFAULT_KEY)
+
+    def _schedule_key_validation(self):
+        """Check the key file in the thread pool; result lands in _on_key_validated."""
+        path = self._current_key_path()
+        if path == self._key_ok_path:
+            return
+        self._key_status.setText("…")
+        self._key_status.setToolTip("Checking key file...")
+        self._key_validator = _KeyValidator(path)
+        self._key_validator.signals.finished.connect(self._on_key_validated)
+        QThreadPool.globalInstance().start(self._key_validator)
+
+    def _on_key_validated(self, path: str, ok: bool, reason: str):
+        """Update the key status indicator, ignoring stale results."""
+        if path != self._current_key_path():
+            return
+        self._key_ok_path = path if ok else None
+        if ok:
+            self._key_status.setText("✓")
+            self._key_status.setStyleSheet("color: #4caf50;")
+            self._key_status.setToolTip("Key file looks valid")
+        else:
+            self._key_status.setText("✗")
+            self._key_status.setStyleSheet("color: #f44336;")
+            self._key_status.setToolTip(reason)
 
     def _on_connect(self):
         """Build profile and accept dialog."""
@@ -256,16 +375,12 @@ class ConnectDialog(QDialog):
                         self.session.hostname,
                         self.session.port
                     )
-                    # DEBUG: Print what we got
-                    print(f"DEBUG: Profile from vault for '{cred_name}':")
-                    print(f"  hostname: {profile.hostname}")
-                    print(f"  port: {profile.port}")
-                    for i, auth in enumerate(profile.auth_methods):
-                        print(f"  auth[{i}]: method={auth.method}, user={auth.username}")
-                        print(f"    password set: {bool(auth.password)}")
-                        print(f"    credential_ref: {auth.credential_ref}")
-                        print(f"    key_path: {auth.key_path}")
-                        print(f"    key_data set: {bool(auth.key_data)}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Profile from vault for %r: %s:%s, auth=%s",
+                            cred_name, profile.hostname, profile.port,
+                            [(a.method.value, a.username) for a in profile.auth_methods],
+                        )
                     return profile
                 except Exception as e:
                     raise ValueError(f"Failed to load credential '{cred_name}': {e}")
@@ -285,16 +400,15 @@ class ConnectDialog(QDialog):
 
         elif "Key File" in tab_text:
             username = self._key_username.text().strip()
-            key_path = self._key_path.text().strip()
+            key_path = self._current_key_path()
             passphrase = self._key_passphrase.text() or None
 
             if not username:
                 raise ValueError("Username required")
-            if not key_path:
-                raise ValueError("Key file path required")
 
             key_path_obj = Path(key_path).expanduser()
-            if not key_path_obj.exists():
+            # Already checked in the background for this exact path
+            if key_path != self._key_ok_path and not key_path_obj.exists():
                 raise ValueError(f"Key file not found: {key_path}")
 
             auth_methods.append(AuthConfig.key_file_auth(
@@ -7,13 +7,14 @@ from typing import Optional, List
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
-    QLineEdit, QSpinBox, QComboBox, QTextEdit,
-    QPushButton, QDialogButtonBox, QGroupBox, QLabel,
+    QLineEdit, QTextEdit,
+    QPushButton, QDialogButtonBox, QGroupBox,
     QWidget
 )
 from PyQt6.QtCore import Qt
 
 from .models import SavedSession
+from ._widgets import HostPortWidget, CredentialCombo
 
 
 class SessionEditorDialog(QDialog):
@@ -54,20 +55,10 @@ class SessionEditorDialog(QDialog):
         basic_layout.addRow("Description:", self._desc_input)
         
         # Host row
-        host_row = QHBoxLayout()
-        self._host_input = QLineEdit()
-        self._host_input.setPlaceholderText("hostname or IP")
-        host_row.addWidget(self._host_input, 1)
-        
-        host_row.addWidget(QLabel(":"))
-        
-        self._port_input = QSpinBox()
-        self._port_input.setRange(1, 65535)
-        self._port_input.setValue(22)
-        self._port_input.setFixedWidth(80)
-        host_row.addWidget(self._port_input)
-        
-        basic_layout.addRow("Host:", host_row)
+        self._hostport = HostPortWidget()
+        self._host_input = self._hostport.host_input
+        self._port_input = self._hostport.port_input
+        basic_layout.addRow("Host:", self._hostport)
         
         layout.addWidget(basic_group)
         
@@ -75,11 +66,7 @@ class SessionEditorDialog(QDialog):
         auth_group = QGroupBox("Authentication")
         auth_layout = QFormLayout(auth_group)
         
-        self._cred_combo = QComboBox()
-        self._cred_combo.addItem("(SSH Agent)", None)
-        self._cred_combo.addItem("(Ask on connect)", "__ask__")
-        for name in self._credential_names:
-            self._cred_combo.addItem(name, name)
+        self._cred_combo = CredentialCombo(self._credential_names)
         auth_layout.addRow("Credential:", self._cred_combo)
         
         layout.addWidget(auth_group)
@@ -100,19 +87,17 @@ class SessionEditorDialog(QDialog):
         """Load session data into form."""
         self._name_input.setText(self._session.name)
         self._desc_input.setText(self._session.description)
-        self._host_input.setText(self._session.hostname)
-        self._port_input.setValue(self._session.port)
+        self._hostport.set_host(self._session.hostname)
+        self._hostport.set_port(self._session.port)
         
         # Select credential
         if self._session.credential_name:
-            idx = self._cred_combo.findData(self._session.credential_name)
-            if idx >= 0:
-                self._cred_combo.setCurrentIndex(idx)
+            self._cred_combo.select_credential(self._session.credential_name)
     
     def _on_accept(self) -> None:
         """Validate and accept."""
         name = self._name_input.text().strip()
-        hostname = self._host_input.text().strip()
+        hostname = self._hostport.host()
         
         if not name:
             self._name_input.setFocus()
@@ -133,8 +118,8 @@ class SessionEditorDialog(QDialog):
             id=self._session.id,
             name=self._name_input.text().strip(),
             description=self._desc_input.text().strip(),
-            hostname=self._host_input.text().strip(),
-            port=self._port_input.value(),
+            hostname=self._hostport.host(),
+            port=self._hostport.port(),
             credential_name=cred_name,
             folder_id=self._session.folder_id,
             position=self._session.position,
@@ -143,20 +128,7 @@ class SessionEditorDialog(QDialog):
     
     def set_credential_names(self, names: List[str]) -> None:
         """Update available credential names."""
-        current = self._cred_combo.currentData()
-        
-        self._cred_combo.clear()
-        self._cred_combo.addItem("(SSH Agent)", None)
-        self._cred_combo.addItem("(Ask on connect)", "__ask__")
-        
-        for name in names:
-            self._cred_combo.addItem(name, name)
-        
-        # Restore selection
-        if current:
-            idx = self._cred_combo.findData(current)
-            if idx >= 0:
-                self._cred_combo.setCurrentIndex(idx)
+        self._cred_combo.set_names(names)
 
 
 class QuickConnectDialog(QDialog):
@@ -183,27 +155,13 @@ class QuickConnectDialog(QDialog):
         form = QFormLayout()
         
         # Host row
-        host_row = QHBoxLayout()
-        self._host_input = QLineEdit()
-        self._host_input.setPlaceholderText("hostname or IP")
-        host_row.addWidget(self._host_input, 1)
-        
-        host_row.addWidget(QLabel(":"))
-        
-        self._port_input = QSpinBox()
-        self._port_input.setRange(1, 65535)
-        self._port_input.setValue(22)
-        self._port_input.setFixedWidth(80)
-        host_row.addWidget(self._port_input)
-        
-        form.addRow("Host:", host_row)
+        self._hostport = HostPortWidget()
+        self._host_input = self._hostport.host_input
+        self._port_input = self._hostport.port_input
+        form.addRow("Host:", self._hostport)
         
         # Credential
-        self._cred_combo = QComboBox()
-        self._cred_combo.addItem("(SSH Agent)", None)
-        self._cred_combo.addItem("(Ask on connect)", "__ask__")
-        for name in self._credential_names:
-            self._cred_combo.addItem(name, name)
+        self._cred_combo = CredentialCombo(self._credential_names)
         form.addRow("Credential:", self._cred_combo)
         
         layout.addLayout(form)
@@ -235,7 +193,7 @@ class QuickConnectDialog(QDialog):
     
     def _accept_with_mode(self, mode: str) -> None:
         """Accept with specified connect mode."""
-        hostname = self._host_input.text().strip()
+        hostname = self._hostport.host()
         if not hostname:
             self._host_input.setFocus()
             return
@@ -248,12 +206,12 @@ class QuickConnectDialog(QDialog):
         cred_data = self._cred_combo.currentData()
         cred_name = cred_data if cred_data and cred_data != "__ask__" else None
         
-        hostname = self._host_input.text().strip()
+        hostname = self._hostport.host()
         
         return SavedSession(
             name=hostname,  # Use hostname as name
             hostname=hostname,
-            port=self._port_input.value(),
+            port=self._hostport.port(),
             credential_name=cred_name,
         )
     
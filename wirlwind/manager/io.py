@@ -8,34 +8,124 @@ Also supports simple CSV import for quick session lists.
 
 from __future__ import annotations
 import csv
+import hashlib
+import io
+import itertools
 import json
-import yaml
-from io import StringIO
+import operator
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
-from dataclasses import asdict
+from typing import Iterator, Optional
 
 from PyQt6.QtWidgets import (
     QWidget, QFileDialog, QMessageBox, QDialog,
     QVBoxLayout, QHBoxLayout, QLabel, QCheckBox,
-    QPushButton, QDialogButtonBox, QTreeWidget,
+    QPushButton, QDialogButtonBox, QTreeWidget, QTreeView,
     QTreeWidgetItem, QGroupBox, QComboBox, QTextEdit
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QModelIndex, Qt, pyqtSignal
 
-from .models import SessionStore, SavedSession, SessionFolder
+from .models import SessionStore, SavedSession
+from ._preview_model import PreviewNode, SessionPreviewModel
+
+_HAS_ORJSON = False
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    pass
+
+_HAS_IJSON = False
+try:
+    import ijson
+    _HAS_IJSON = True
+except ImportError:
+    pass
 
 
 # Export format version for future compatibility
 EXPORT_VERSION = 1
 
+# JSON imports at least this large are streamed with ijson when available
+STREAM_IMPORT_MIN_BYTES = 1024 * 1024
+
+# Import previews build tree rows for at most this many sessions; the
+# rest are only counted
+PREVIEW_MAX_SESSIONS = 5000
+
+# Previews with more sessions than this open with folders collapsed
+_PREVIEW_EXPAND_MAX = 500
+
+# Export payloads are written to the fd in slices of this size
+_WRITE_CHUNK = 1024 * 1024
+
+# TerminalTelemetry session keys, fetched together with one map(sess.get)
+_TT_KEYS = ("host", "display_name", "DeviceType", "Model", "Vendor", "port")
+
+# Sniffed CSV dialects keyed by a digest of the file's first 256 bytes
+_DIALECT_CACHE: dict[bytes, type[csv.Dialect]] = {}
+_DIALECT_CACHE_MAX = 64
+
+# csv.Sniffer only sees whole lines from this much of the sample; its
+# quote regexes can backtrack badly on long pathological input
+_SNIFF_MAX_CHARS = 2048
+
+# Delimiters considered when guessing from the header line alone
+_CSV_DELIMITERS = ",;\t|"
+
+
+def _loads_json(raw: bytes):
+    """Parse a JSON document from bytes, with orjson when available."""
+    if raw.startswith(b"\xef\xbb\xbf"):
+        raw = raw[3:]  # BOM from Windows editors; orjson rejects it
+    return orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+
+
+def _load_yaml(stream):
+    """
+    Safe-load YAML, importing PyYAML on first use.
+
+    Uses the libyaml-backed CSafeLoader when present. PyPI wheels for
+    PyYAML bundle libyaml; source builds need the libyaml headers
+    installed (e.g. libyaml-dev / libyaml-devel) or this falls back to
+    the pure-Python SafeLoader.
+    """
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+def _session_row(session: SavedSession) -> dict:
+    """Export dict for one session."""
+    row = {
+        "name": session.name,
+        "description": session.description,
+        "hostname": session.hostname,
+        "port": session.port,
+        "credential_name": session.credential_name,
+        "folder_id": session.folder_id,
+        "position": session.position,
+    }
+    if session.extras:
+        row["extras"] = session.extras
+    return row
+
+
+def _session_row_stats(session: SavedSession) -> dict:
+    """Export dict for one session, with connect statistics."""
+    row = _session_row(session)
+    row["connect_count"] = session.connect_count
+    if session.last_connected:
+        row["last_connected"] = str(session.last_connected)
+    return row
+
 
 def export_sessions(
     store: SessionStore,
     path: Path,
-    include_stats: bool = False
+    include_stats: bool = False,
+    pretty: bool = False
 ) -> int:
     """
     Export all sessions to JSON file.
@@ -44,56 +134,131 @@ def export_sessions(
         store: Session store instance
         path: Output file path
         include_stats: Include connect_count and last_connected
+        pretty: Indent the JSON (2 spaces) instead of writing it compact
 
     Returns:
         Number of sessions exported
     """
+    payload, count = _build_export_payload(store, include_stats, pretty)
+    _write_export_bytes(path, payload)
+    return count
+
+
+def _build_export_payload(
+    store: SessionStore,
+    include_stats: bool,
+    pretty: bool
+) -> tuple[bytes, int]:
+    """Serialized export JSON and its session count (reads the store)."""
     tree_data = store.get_tree()
 
+    # Pick the row builder once rather than branching per session
+    row_fn = _session_row_stats if include_stats else _session_row
+
     # Build export structure
     export_data = {
         "version": EXPORT_VERSION,
         "exported_at": datetime.now().isoformat(),
-        "folders": [],
-        "sessions": [],
+        "folders": [
+            {
+                "id": folder.id,
+                "name": folder.name,
+                "parent_id": folder.parent_id,
+                "position": folder.position,
+            }
+            for folder in tree_data["folders"]
+        ],
+        "sessions": [row_fn(s) for s in tree_data["sessions"]],
     }
 
-    # Export folders
-    for folder in tree_data["folders"]:
-        export_data["folders"].append({
-            "id": folder.id,
-            "name": folder.name,
-            "parent_id": folder.parent_id,
-            "position": folder.position,
-        })
+    # Serialize in one go; _write_export_bytes does the I/O
+    if _HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(export_data, option=option)
+    elif pretty:
+        payload = json.dumps(export_data, indent=2).encode()
+    else:
+        payload = json.dumps(export_data, separators=(",", ":")).encode()
+
+    return payload, len(export_data["sessions"])
+
+
+def _write_export_bytes(path: Path, payload: bytes) -> None:
+    """
+    Write payload to path with raw os.write calls in _WRITE_CHUNK slices.
+
+    Touches no store or Qt objects, so it is safe to run off the GUI
+    thread.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view[:_WRITE_CHUNK])
+            view = view[written:]
+    finally:
+        os.close(fd)
 
-    # Export sessions
-    for session in tree_data["sessions"]:
-        session_data = {
-            "name": session.name,
-            "description": session.description,
-            "hostname": session.hostname,
-            "port": session.port,
-            "credential_name": session.credential_name,
-            "folder_id": session.folder_id,
-            "position": session.position,
-        }
 
-        if session.extras:
-            session_data["extras"] = session.extras
+class _ExportWriterSignals(QObject):
+    finished = pyqtSignal(str)  # error message, "" on success
 
-        if include_stats:
-            session_data["connect_count"] = session.connect_count
-            if session.last_connected:
-                session_data["last_connected"] = str(session.last_connected)
 
-        export_data["sessions"].append(session_data)
+class _ExportWriter(QRunnable):
+    """Writes a serialized export in the thread pool."""
 
-    # Write file
-    with open(path, "w") as f:
-        json.dump(export_data, f, indent=2)
+    def __init__(self, path: Path, payload: bytes):
+        super().__init__()
+        self.path = path
+        self.payload = payload
+        self.signals = _ExportWriterSignals()
 
-    return len(export_data["sessions"])
+    def run(self):
+        try:
+            _write_export_bytes(self.path, self.payload)
+        except OSError as e:
+            self.signals.finished.emit(str(e) or repr(e))
+        else:
+            self.signals.finished.emit("")
+
+
+class _SessionMerger:
+    """
+    Decide per imported session whether to queue, update or replace.
+
+    Hostnames are matched against the store and against sessions queued
+    earlier in the same file. A stored match is updated in place; a
+    repeat within the file replaces the queued copy, so the last one
+    wins and add_sessions() never sees the hostname twice.
+    """
+
+    def __init__(self, store: SessionStore):
+        self._update = store.update_session
+        self._by_host = {s.hostname: s for s in store.list_all_sessions()}
+        # hostname -> index in new_sessions
+        self._queued: dict[str, int] = {}
+        self.new_sessions: list[SavedSession] = []
+
+    def __contains__(self, hostname: str) -> bool:
+        return hostname in self._by_host
+
+    def add(self, session: SavedSession) -> None:
+        hostname = session.hostname
+        existing = self._by_host.get(hostname)
+        if existing is None:
+            self._queued[hostname] = len(self.new_sessions)
+            self.new_sessions.append(session)
+        elif existing.id is None:
+            # Repeated within this file: the first copy is still queued
+            self.new_sessions[self._queued[hostname]] = session
+        else:
+            session.id = existing.id
+            self._update(session)
+            return
+        self._by_host[hostname] = session
 
 
 def import_sessions(
@@ -112,18 +277,46 @@ def import_sessions(
     Returns:
         Tuple of (sessions_imported, sessions_skipped)
     """
-    with open(path) as f:
-        data = json.load(f)
+    path = Path(path)
+
+    if _HAS_IJSON and path.stat().st_size >= STREAM_IMPORT_MIN_BYTES:
+        # Large export: folders are few, so collect them in one pass,
+        # then stream sessions one dict at a time in a second pass
+        with open(path, "rb") as f:
+            folders = list(ijson.items(f, "folders.item", use_float=True))
+            f.seek(0)
+            sessions = ijson.items(f, "sessions.item", use_float=True)
+            with store.transaction():
+                return _import_session_data(store, folders, sessions, merge)
+
+    # One read, parsed from bytes (no text-layer decode)
+    data = _loads_json(path.read_bytes())
+
+    with store.transaction():
+        return _import_session_data(
+            store, data.get("folders", []), data.get("sessions", []), merge
+        )
 
-    version = data.get("version", 1)
 
+def _import_session_data(
+    store: SessionStore,
+    folders: list[dict],
+    sessions,
+    merge: bool
+) -> tuple[int, int]:
+    """Import parsed export folders and an iterable of session dicts."""
     # Build folder ID mapping (old ID -> new ID)
     folder_map: dict[int, int] = {}
 
     # Import folders first
-    if "folders" in data:
-        # Sort by parent to ensure parents are created first
-        folders = sorted(data["folders"], key=lambda f: (f.get("parent_id") or 0, f.get("position", 0)))
+    if folders:
+        # Sort by parent to ensure parents are created first; keys are
+        # computed once per folder rather than by a lambda
+        decorated = [
+            ((f.get("parent_id") or 0, f.get("position", 0)), f) for f in folders
+        ]
+        decorated.sort(key=operator.itemgetter(0))
+        folders = [f for _, f in decorated]
 
         for folder_data in folders:
             old_id = folder_data.get("id")
@@ -152,14 +345,17 @@ def import_sessions(
     imported = 0
     skipped = 0
 
-    existing_sessions = {s.hostname: s for s in store.list_all_sessions()}
+    merger = _SessionMerger(store)
 
-    for session_data in data.get("sessions", []):
+    # Hot-loop lookups bound once
+    add_session = merger.add
+
+    for session_data in sessions:
         hostname = session_data.get("hostname")
         name = session_data.get("name")
 
         # Check for duplicate by hostname
-        if hostname in existing_sessions and not merge:
+        if not merge and hostname in merger:
             skipped += 1
             continue
 
@@ -170,7 +366,7 @@ def import_sessions(
         else:
             folder_id = None
 
-        session = SavedSession(
+        session = SavedSession._fast_new(
             name=name or hostname,
             description=session_data.get("description", ""),
             hostname=hostname,
@@ -180,24 +376,112 @@ def import_sessions(
             extras=session_data.get("extras", {}),
         )
 
-        # Check if we're updating existing
-        if hostname in existing_sessions and merge:
-            existing = existing_sessions[hostname]
-            session.id = existing.id
-            store.update_session(session)
-        else:
-            store.add_session(session)
+        add_session(session)
 
         imported += 1
 
+    store.add_sessions(merger.new_sessions)
+
     return imported, skipped
 
 
+def _guess_dialect(sample: str) -> type[csv.Dialect]:
+    """Excel dialect using whichever delimiter is most common in the header."""
+    first_line = sample.partition("\n")[0]
+    delimiter = max(_CSV_DELIMITERS, key=first_line.count)
+    if delimiter == "," or delimiter not in first_line:
+        return csv.excel
+    if delimiter == "\t":
+        return csv.excel_tab
+    return type("excel_delimited", (csv.excel,), {"delimiter": delimiter})
+
+
+def _sniff_dialect(sample: str, detect: bool = True) -> type[csv.Dialect]:
+    """
+    Dialect for a CSV sample, skipping the sniffer where possible.
+
+    With detect off, only the header delimiter is guessed and
+    csv.Sniffer is never run.
+    """
+    if not detect:
+        return _guess_dialect(sample)
+
+    # Plain comma-separated with no quoting anywhere: nothing to sniff
+    first_line = sample.partition("\n")[0]
+    if ("," in first_line and '"' not in sample and "'" not in sample
+            and not any(c in first_line for c in ";\t|")):
+        return csv.excel
+
+    key = hashlib.blake2b(sample.encode()[:256], digest_size=8).digest()
+    dialect = _DIALECT_CACHE.get(key)
+    if dialect is None:
+        if len(sample) > _SNIFF_MAX_CHARS:
+            cut = sample.rfind("\n", 0, _SNIFF_MAX_CHARS)
+            sample = sample[:cut] if cut > 0 else sample[:_SNIFF_MAX_CHARS]
+        try:
+            dialect = csv.Sniffer().sniff(sample)
+        except csv.Error:
+            dialect = csv.excel  # Default to standard CSV
+        if len(_DIALECT_CACHE) >= _DIALECT_CACHE_MAX:
+            _DIALECT_CACHE.clear()
+        _DIALECT_CACHE[key] = dialect
+    return dialect
+
+
+# CSV column name candidates, in priority order
+_CSV_NAME_COLS = ('name', 'display_name', 'session_name', 'device_name', 'device')
+_CSV_HOST_COLS = ('hostname', 'host', 'ip', 'ip_address', 'address', 'mgmt_ip')
+_CSV_PORT_COLS = ('port', 'ssh_port')
+_CSV_DESC_COLS = ('description', 'desc', 'notes', 'comment')
+_CSV_FOLDER_COLS = ('folder', 'folder_name', 'group', 'site', 'location')
+
+
+def _csv_columns(header: list[str], *candidates: tuple[str, ...]) -> tuple[tuple[int, ...], ...]:
+    """
+    Resolve each candidate name tuple to the matching column indices.
+
+    Header names are normalized (lowercase, stripped); on duplicate
+    names the last column wins, as it did with DictReader.
+    """
+    header_index = {h.lower().strip(): i for i, h in enumerate(header)}
+    return tuple(
+        tuple(header_index[col] for col in names if col in header_index)
+        for names in candidates
+    )
+
+
+def _csv_value(row: list[str], columns: tuple[int, ...]) -> Optional[str]:
+    """First non-empty value among the resolved columns, stripped."""
+    # Plain loop: columns is usually one index, and a next() over a
+    # generator costs several times more than the lookup itself
+    width = len(row)
+    for i in columns:
+        if i < width:
+            value = row[i]
+            if value:
+                return value.strip()
+    return None
+
+
+def _iter_csv_rows(path: Path, detect_dialect: bool = True) -> Iterator[list[str]]:
+    """Yield the rows of a CSV file, header first, sniffing its dialect."""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        # Sniff dialect and read
+        sample = f.read(4096)
+        dialect = _sniff_dialect(sample, detect_dialect)
+
+        # Parse the already-decoded sample (completed to the end of its
+        # line) instead of seeking back and decoding it a second time
+        head = io.StringIO(sample + f.readline(), newline='')
+        yield from csv.reader(itertools.chain(head, f), dialect=dialect)
+
+
 def import_sessions_csv(
     store: SessionStore,
     path: Path,
     merge: bool = True,
-    folder_name: Optional[str] = None
+    folder_name: Optional[str] = None,
+    detect_dialect: bool = True
 ) -> tuple[int, int, int]:
     """
     Import sessions from CSV file.
@@ -214,108 +498,84 @@ def import_sessions_csv(
         path: Input CSV file path
         merge: If True, merge with existing. If False, skip duplicates.
         folder_name: Override folder for all imported sessions (optional)
+        detect_dialect: If False, skip csv.Sniffer and only guess the
+            delimiter from the header line
 
     Returns:
         Tuple of (folders_created, sessions_imported, sessions_skipped)
     """
-    with open(path, newline='', encoding='utf-8-sig') as f:
-        # Sniff dialect and read
-        sample = f.read(4096)
-        f.seek(0)
-
-        try:
-            dialect = csv.Sniffer().sniff(sample)
-        except csv.Error:
-            dialect = csv.excel  # Default to standard CSV
+    # Rows are streamed; the file stays open until the loop below ends
+    rows = _iter_csv_rows(path, detect_dialect)
+    header = next(rows, None)
 
-        reader = csv.DictReader(f, dialect=dialect)
-
-        # Normalize header names (lowercase, strip whitespace)
-        if reader.fieldnames:
-            reader.fieldnames = [h.lower().strip() for h in reader.fieldnames]
-
-        rows = list(reader)
-
-    if not rows:
+    if not header:
         return 0, 0, 0
 
-    # Column name mappings (first match wins)
-    name_cols = ['name', 'display_name', 'session_name', 'device_name', 'device']
-    host_cols = ['hostname', 'host', 'ip', 'ip_address', 'address', 'mgmt_ip']
-    port_cols = ['port', 'ssh_port']
-    desc_cols = ['description', 'desc', 'notes', 'comment']
-    folder_cols = ['folder', 'folder_name', 'group', 'site', 'location']
-
-    def find_col(row: dict, candidates: list[str]) -> Optional[str]:
-        """Find first matching column value."""
-        for col in candidates:
-            if col in row and row[col]:
-                return row[col].strip()
-        return None
+    # Resolve column candidates to indices once; usually one each
+    name_cols, host_cols, port_cols, desc_cols, folder_cols = _csv_columns(
+        header, _CSV_NAME_COLS, _CSV_HOST_COLS, _CSV_PORT_COLS,
+        _CSV_DESC_COLS, _CSV_FOLDER_COLS,
+    )
 
     # Track folders and sessions
     folders_created = 0
     sessions_imported = 0
     sessions_skipped = 0
 
-    existing_sessions = {s.hostname: s for s in store.list_all_sessions()}
-    folder_cache: dict[str, int] = {}  # folder_name -> folder_id
+    merger = _SessionMerger(store)
 
-    for row in rows:
-        # Extract fields with fallbacks
-        hostname = find_col(row, host_cols)
-        if not hostname:
-            continue  # Skip rows without hostname
+    # folder_name -> folder_id, seeded from the root folders once
+    folder_cache: dict[str, int] = {}
+    for folder in store.list_folders(None):
+        folder_cache.setdefault(folder.name, folder.id)
 
-        name = find_col(row, name_cols) or hostname
-        port_str = find_col(row, port_cols)
-        port = int(port_str) if port_str and port_str.isdigit() else 22
-        description = find_col(row, desc_cols) or ""
+    # Hot-loop lookups bound once
+    add_folder = store.add_folder
+    add_session = merger.add
+    folder_cache_get = folder_cache.get
 
-        # Determine folder
-        row_folder = folder_name or find_col(row, folder_cols)
-        folder_id = None
+    with store.transaction():
+        for row in rows:
+            # Extract fields with fallbacks
+            hostname = _csv_value(row, host_cols)
+            if not hostname:
+                continue  # Skip rows without hostname
 
-        if row_folder:
-            if row_folder in folder_cache:
-                folder_id = folder_cache[row_folder]
-            else:
-                # Check if folder exists
-                existing_folders = store.list_folders(None)
-                existing = next((f for f in existing_folders if f.name == row_folder), None)
-
-                if existing:
-                    folder_id = existing.id
-                else:
-                    folder_id = store.add_folder(row_folder)
+            name = _csv_value(row, name_cols) or hostname
+            port_str = _csv_value(row, port_cols)
+            port = int(port_str) if port_str and port_str.isdigit() else 22
+            description = _csv_value(row, desc_cols) or ""
+
+            # Determine folder
+            row_folder = folder_name or _csv_value(row, folder_cols)
+            folder_id = None
+
+            if row_folder:
+                folder_id = folder_cache_get(row_folder)
+                if folder_id is None:
+                    folder_id = add_folder(row_folder)
                     folders_created += 1
+                    folder_cache[row_folder] = folder_id
 
-                folder_cache[row_folder] = folder_id
+            # Check for duplicate
+            if not merge and hostname in merger:
+                sessions_skipped += 1
+                continue
 
-        # Check for duplicate
-        if hostname in existing_sessions and not merge:
-            sessions_skipped += 1
-            continue
+            session = SavedSession._fast_new(
+                name=name,
+                description=description,
+                hostname=hostname,
+                port=port,
+                credential_name=None,
+                folder_id=folder_id,
+            )
 
-        session = SavedSession(
-            name=name,
-            description=description,
-            hostname=hostname,
-            port=port,
-            credential_name=None,
-            folder_id=folder_id,
-        )
+            add_session(session)
 
-        # Update or insert
-        if hostname in existing_sessions and merge:
-            existing = existing_sessions[hostname]
-            session.id = existing.id
-            store.update_session(session)
-        else:
-            store.add_session(session)
-            existing_sessions[hostname] = session
+            sessions_imported += 1
 
-        sessions_imported += 1
+        store.add_sessions(merger.new_sessions)
 
     return folders_created, sessions_imported, sessions_skipped
 
@@ -337,7 +597,7 @@ def import_terminal_telemetry(
         Tuple of (folders_created, sessions_imported, sessions_skipped)
     """
     with open(path) as f:
-        data = yaml.safe_load(f)
+        data = _load_yaml(f)
 
     if not isinstance(data, list):
         raise ValueError("Invalid TerminalTelemetry format: expected list of folders")
@@ -346,79 +606,255 @@ def import_terminal_telemetry(
     sessions_imported = 0
     sessions_skipped = 0
 
-    existing_sessions = {s.hostname: s for s in store.list_all_sessions()}
+    merger = _SessionMerger(store)
 
-    for folder_entry in data:
-        folder_name = folder_entry.get("folder_name", "Imported")
-        sessions = folder_entry.get("sessions", [])
+    # Root folders by name, fetched once
+    folder_cache: dict[str, int] = {}
+    for folder in store.list_folders(None):
+        folder_cache.setdefault(folder.name, folder.id)
 
-        if not sessions:
-            continue  # Skip empty folders
+    # Folders still to create, in file order; empty folders are skipped
+    new_folders = [
+        name for name in dict.fromkeys(
+            entry.get("folder_name", "Imported") for entry in data if entry.get("sessions")
+        )
+        if name not in folder_cache
+    ]
 
-        # Find or create folder
-        existing_folders = store.list_folders(None)  # Root level
-        folder = next((f for f in existing_folders if f.name == folder_name), None)
+    # Hot-loop lookups bound once
+    add_session = merger.add
 
-        if not folder:
-            folder_id = store.add_folder(folder_name)
-            folders_created += 1
+    with store.transaction():
+        folder_cache.update(zip(new_folders, store.add_folders(new_folders)))
+        folders_created = len(new_folders)
+
+        for folder_entry in data:
+            folder_name = folder_entry.get("folder_name", "Imported")
+            sessions = folder_entry.get("sessions", [])
+
+            if not sessions:
+                continue  # Skip empty folders
+
+            folder_id = folder_cache[folder_name]
+
+            # Import sessions in this folder
+            for sess in sessions:
+                hostname, display_name, device_type, model, vendor, port = map(
+                    sess.get, _TT_KEYS
+                )
+                if not hostname:
+                    continue
+
+                # Check for duplicate
+                if not merge and hostname in merger:
+                    sessions_skipped += 1
+                    continue
+
+                # Build description from DeviceType and Model
+                description = " - ".join(filter(None, (device_type, model)))
+
+                # Store extra metadata
+                extras = {}
+                if vendor:
+                    extras["vendor"] = vendor
+                if device_type:
+                    extras["device_type"] = device_type
+                if model:
+                    extras["model"] = model
+
+                session = SavedSession._fast_new(
+                    name=hostname if display_name is None else display_name,
+                    description=description,
+                    hostname=hostname,
+                    port=22 if port is None else int(port),
+                    credential_name=None,  # Use agent auth by default
+                    folder_id=folder_id,
+                    extras=extras,
+                )
+
+                add_session(session)
+
+                sessions_imported += 1
+
+        store.add_sessions(merger.new_sessions)
+
+    return folders_created, sessions_imported, sessions_skipped
+
+
+# =============================================================================
+# Preview parsing (thread pool)
+# =============================================================================
+
+def _parse_csv_preview(path: Path, detect_dialect: bool) -> tuple[PreviewNode, int, Path]:
+    """
+    Build the CSV preview tree from the streamed rows.
+
+    Returns (root, session count, path); sessions past
+    PREVIEW_MAX_SESSIONS are counted but get no tree row. Touches no
+    widgets or store, so it runs in the thread pool.
+    """
+    root = PreviewNode()
+    total = 0
+
+    rows = _iter_csv_rows(path, detect_dialect)
+    header = next(rows, None)
+    if not header:
+        return root, total, path
+
+    name_cols, host_cols, port_cols, folder_cols = _csv_columns(
+        header, _CSV_NAME_COLS, _CSV_HOST_COLS, _CSV_PORT_COLS, _CSV_FOLDER_COLS
+    )
+
+    # Group by folder for preview; folders and their session counts
+    # cover every row, session rows stop at the cap
+    folder_items: dict[str, PreviewNode] = {}
+    folder_counts: dict[str, int] = {}
+    root_sessions: list[PreviewNode] = []
+
+    for row in rows:
+        hostname = _csv_value(row, host_cols)
+        if not hostname:
+            continue
+
+        total += 1
+        folder = _csv_value(row, folder_cols)
+
+        folder_item = None
+        if folder:
+            # One dict probe per row; folders are created on first sight
+            # so the rows can stay streamed
+            folder_item = folder_items.get(folder)
+            if folder_item is None:
+                folder_item = folder_items[folder] = root.add(PreviewNode())
+                folder_counts[folder] = 0
+            folder_counts[folder] += 1
+
+        if total > PREVIEW_MAX_SESSIONS:
+            continue
+
+        name = _csv_value(row, name_cols) or hostname
+        port = _csv_value(row, port_cols) or "22"
+
+        item = PreviewNode(name, hostname, port)
+
+        if folder_item is not None:
+            folder_item.add(item)
         else:
-            folder_id = folder.id
+            root_sessions.append(item)
 
-        # Import sessions in this folder
-        for sess in sessions:
-            hostname = sess.get("host", "")
-            if not hostname:
-                continue
+    # Add ungrouped sessions at root
+    for item in root_sessions:
+        root.add(item)
 
-            # Check for duplicate
-            if hostname in existing_sessions and not merge:
-                sessions_skipped += 1
+    for folder, folder_item in folder_items.items():
+        folder_item.text = (f"📁 {folder} ({folder_counts[folder]})",)
+
+    return root, total, path
+
+
+def _parse_json_preview(path: Path) -> tuple[PreviewNode, int, dict]:
+    """
+    Build the JSON export preview tree.
+
+    Returns (root, session count, folder list kept for import); as for
+    CSV, sessions past PREVIEW_MAX_SESSIONS are only counted. Touches
+    no widgets or store, so it runs in the thread pool.
+    """
+    root = PreviewNode()
+    total = 0
+
+    with open(path, "rb") as f:
+        if _HAS_IJSON and path.stat().st_size >= STREAM_IMPORT_MIN_BYTES:
+            # Same two passes as import_sessions: folders are few,
+            # sessions are streamed without holding the parsed list
+            folders = list(ijson.items(f, "folders.item", use_float=True))
+            f.seek(0)
+            sessions = ijson.items(f, "sessions.item", use_float=True)
+        else:
+            data = _loads_json(f.read())
+            folders = data.get("folders", [])
+            sessions = data.get("sessions", [])
+
+        # Create folder items
+        folder_items: dict[int, PreviewNode] = {}
+        for folder_data in folders:
+            folder_items[folder_data["id"]] = PreviewNode(f"📁 {folder_data['name']}")
+
+        # Parent folders
+        for folder_data in folders:
+            item = folder_items[folder_data["id"]]
+            parent_id = folder_data.get("parent_id")
+            if parent_id and parent_id in folder_items:
+                folder_items[parent_id].add(item)
+            else:
+                root.add(item)
+
+        # Add sessions; every session counts toward its folder, rows
+        # stop at the cap
+        folder_counts = dict.fromkeys(folder_items, 0)
+        for session_data in sessions:
+            total += 1
+
+            folder_id = session_data.get("folder_id")
+            folder_item = folder_items.get(folder_id) if folder_id else None
+            if folder_item is not None:
+                folder_counts[folder_id] += 1
+
+            if total > PREVIEW_MAX_SESSIONS:
                 continue
 
-            # Build description from DeviceType and Model
-            device_type = sess.get("DeviceType", "")
-            model = sess.get("Model", "")
-            vendor = sess.get("Vendor", "")
-
-            desc_parts = []
-            if device_type:
-                desc_parts.append(device_type)
-            if model:
-                desc_parts.append(model)
-            description = " - ".join(desc_parts) if desc_parts else ""
-
-            # Store extra metadata
-            extras = {}
-            if vendor:
-                extras["vendor"] = vendor
-            if device_type:
-                extras["device_type"] = device_type
-            if model:
-                extras["model"] = model
-
-            session = SavedSession(
-                name=sess.get("display_name", hostname),
-                description=description,
-                hostname=hostname,
-                port=int(sess.get("port", 22)),
-                credential_name=None,  # Use agent auth by default
-                folder_id=folder_id,
-                extras=extras,
+            item = PreviewNode(
+                session_data.get("name", ""),
+                session_data.get("hostname", ""),
+                str(session_data.get("port", 22)),
             )
 
-            # Check if updating existing
-            if hostname in existing_sessions and merge:
-                existing = existing_sessions[hostname]
-                session.id = existing.id
-                store.update_session(session)
+            if folder_item is not None:
+                folder_item.add(item)
             else:
-                store.add_session(session)
-                existing_sessions[hostname] = session  # Track for duplicates
+                root.add(item)
 
-            sessions_imported += 1
+        for folder_data in folders:
+            folder_id = folder_data["id"]
+            folder_items[folder_id].text = (
+                f"📁 {folder_data['name']} ({folder_counts[folder_id]})",
+            )
 
-    return folders_created, sessions_imported, sessions_skipped
+    # Only the folder list is kept; import re-reads the file
+    return root, total, {"folders": folders}
+
+
+def _parse_tt_preview(path: Path) -> list:
+    """Load a TerminalTelemetry sessions.yaml and check its shape."""
+    with open(path) as f:
+        data = _load_yaml(f)
+
+    if not isinstance(data, list):
+        raise ValueError("Invalid format: expected list of folders")
+    return data
+
+
+class _PreviewParserSignals(QObject):
+    finished = pyqtSignal(object)  # the parse function's result
+    failed = pyqtSignal(str)  # error message
+
+
+class _PreviewParser(QRunnable):
+    """Runs a preview parse function in the thread pool."""
+
+    def __init__(self, parse, *args):
+        super().__init__()
+        self.parse = parse
+        self.args = args
+        self.signals = _PreviewParserSignals()
+
+    def run(self):
+        try:
+            result = self.parse(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e) or repr(e))
+        else:
+            self.signals.finished.emit(result)
 
 
 class ExportDialog(QDialog):
@@ -433,10 +869,9 @@ class ExportDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
-        # Info
-        tree_data = store.get_tree()
-        count = len(tree_data["sessions"])
-        folder_count = len(tree_data["folders"])
+        # Info (counted in SQL; the tree itself is only loaded on export)
+        count = store.count_sessions()
+        folder_count = store.count_folders()
 
         info = QLabel(f"Export {count} sessions and {folder_count} folders to JSON file.")
         layout.addWidget(info)
@@ -449,6 +884,10 @@ class ExportDialog(QDialog):
         self._include_stats.setToolTip("Export connect count and last connected timestamp")
         options_layout.addWidget(self._include_stats)
 
+        self._pretty = QCheckBox("Pretty-print")
+        self._pretty.setToolTip("Indent the JSON for hand editing (larger file)")
+        options_layout.addWidget(self._pretty)
+
         layout.addWidget(options_group)
 
         # Buttons
@@ -459,6 +898,9 @@ class ExportDialog(QDialog):
         buttons.accepted.connect(self._on_save)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
+        self._buttons = buttons
+
+        self._writer: Optional[_ExportWriter] = None
 
     def _on_save(self) -> None:
         """Handle save button."""
@@ -470,24 +912,46 @@ class ExportDialog(QDialog):
         )
 
         if path:
+            # The store's sqlite connection belongs to this thread, so
+            # read and serialize here; only the file write is handed off
             try:
-                count = export_sessions(
+                payload, count = _build_export_payload(
                     self.store,
-                    Path(path),
-                    include_stats=self._include_stats.isChecked()
-                )
-                QMessageBox.information(
-                    self,
-                    "Export Complete",
-                    f"Exported {count} sessions to:\n{path}"
+                    include_stats=self._include_stats.isChecked(),
+                    pretty=self._pretty.isChecked()
                 )
-                self.accept()
             except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Export Failed",
-                    f"Failed to export sessions:\n{e}"
-                )
+                self._on_export_failed(e)
+                return
+
+            self._buttons.setEnabled(False)
+            self._writer = _ExportWriter(Path(path), payload)
+            self._writer.signals.finished.connect(
+                lambda error: self._on_export_written(path, count, error)
+            )
+            QThreadPool.globalInstance().start(self._writer)
+
+    def _on_export_written(self, path: str, count: int, error: str) -> None:
+        """Report the result of the background write."""
+        self._writer = None
+        self._buttons.setEnabled(True)
+        if error:
+            self._on_export_failed(error)
+            return
+        QMessageBox.information(
+            self,
+            "Export Complete",
+            f"Exported {count} sessions to:\n{path}"
+        )
+        self.accept()
+
+    def _on_export_failed(self, error) -> None:
+        """Show an export error."""
+        QMessageBox.critical(
+            self,
+            "Export Failed",
+            f"Failed to export sessions:\n{error}"
+        )
 
 
 # =============================================================================
@@ -540,7 +1004,8 @@ class ImportDialog(QDialog):
         super().__init__(parent)
         self.store = store
         self._import_path: Optional[Path] = None
-        self._import_data = None  # Can be dict (JSON) or list of rows (CSV)
+        self._import_data = None  # Folder list dict (JSON) or file path (CSV)
+        self._parser: Optional[_PreviewParser] = None
         self._import_format: str = "json"
 
         self.setWindowTitle("Import Sessions")
@@ -584,9 +1049,9 @@ class ImportDialog(QDialog):
         self._file_label = QLabel("No file selected")
         file_row.addWidget(self._file_label, 1)
 
-        browse_btn = QPushButton("Browse...")
-        browse_btn.clicked.connect(self._browse_file)
-        file_row.addWidget(browse_btn)
+        self._browse_btn = QPushButton("Browse...")
+        self._browse_btn.clicked.connect(self._browse_file)
+        file_row.addWidget(self._browse_btn)
 
         layout.addLayout(file_row)
 
@@ -594,12 +1059,23 @@ class ImportDialog(QDialog):
         preview_group = QGroupBox("Preview")
         preview_layout = QVBoxLayout(preview_group)
 
-        self._preview_tree = QTreeWidget()
-        self._preview_tree.setHeaderLabels(["Name", "Host", "Port"])
+        self._preview_model = SessionPreviewModel(("Name", "Host", "Port"), self)
+        self._preview_tree = QTreeView()
+        self._preview_tree.setUniformRowHeights(True)
         self._preview_tree.setRootIsDecorated(True)
         self._preview_tree.setAlternatingRowColors(True)
+        self._preview_tree.setModel(self._preview_model)
         preview_layout.addWidget(self._preview_tree)
 
+        expand_row = QHBoxLayout()
+        expand_row.addStretch()
+        self._expand_btn = QPushButton("Expand All")
+        self._expand_btn.clicked.connect(
+            lambda: self._preview_tree.expandRecursively(QModelIndex(), -1)
+        )
+        expand_row.addWidget(self._expand_btn)
+        preview_layout.addLayout(expand_row)
+
         layout.addWidget(preview_group)
 
         # Options
@@ -614,6 +1090,15 @@ class ImportDialog(QDialog):
         )
         options_layout.addWidget(self._merge_check)
 
+        self._detect_check = QCheckBox("Auto-detect delimiter")
+        self._detect_check.setToolTip(
+            "If checked, CSV quoting and delimiter are detected with csv.Sniffer.\n"
+            "If unchecked, the delimiter is guessed from the header line."
+        )
+        self._detect_check.toggled.connect(self._on_detect_toggled)
+        self._detect_check.hide()
+        options_layout.addWidget(self._detect_check)
+
         layout.addWidget(options_group)
 
         # Buttons
@@ -636,15 +1121,21 @@ class ImportDialog(QDialog):
             self._help_panel.setHtml(CSV_HELP_TEXT)
         else:
             self._help_panel.setHtml(JSON_HELP_TEXT)
+        self._detect_check.setVisible(self._import_format == "csv")
 
         # Clear preview if format changed after file loaded
         if self._import_path:
-            self._preview_tree.clear()
+            self._preview_model.clear()
             self._import_path = None
             self._import_data = None
             self._file_label.setText("No file selected")
             self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
 
+    def _on_detect_toggled(self, checked: bool) -> None:
+        """Re-read a loaded CSV with the new delimiter handling."""
+        if self._import_path and self._import_format == "csv":
+            self._load_preview(self._import_path)
+
     def _toggle_help(self, show: bool) -> None:
         """Show/hide help panel."""
         self._help_panel.setVisible(show)
@@ -668,130 +1159,88 @@ class ImportDialog(QDialog):
             self._load_preview(Path(path))
 
     def _load_preview(self, path: Path) -> None:
-        """Load and preview import file."""
-        try:
-            self._preview_tree.clear()
-
-            if self._import_format == "csv":
-                self._load_csv_preview(path)
-            else:
-                self._load_json_preview(path)
+        """Parse the import file in the thread pool, then show the preview."""
+        # The current preview stays until the new one is parsed, so a
+        # failed load leaves it matching _import_path
+        if self._import_format == "csv":
+            parser = _PreviewParser(
+                _parse_csv_preview, path, self._detect_check.isChecked()
+            )
+        else:
+            parser = _PreviewParser(_parse_json_preview, path)
 
-            self._import_path = path
+        parser.signals.finished.connect(
+            lambda result: self._on_preview_parsed(parser, path, result)
+        )
+        parser.signals.failed.connect(
+            lambda error: self._on_preview_failed(parser, error)
+        )
+        self._parser = parser
+        self._set_loading(path)
+        QThreadPool.globalInstance().start(parser)
+
+    def _set_loading(self, path: Optional[Path]) -> None:
+        """Lock the file controls while path is parsed; None unlocks them."""
+        busy = path is not None
+        for widget in (self._browse_btn, self._format_combo, self._detect_check):
+            widget.setEnabled(not busy)
+
+        if busy:
+            self._file_label.setText(f"Loading {path.name}...")
+            self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
+            self.setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.unsetCursor()
+
+    def _on_preview_parsed(self, parser: _PreviewParser, path: Path, result) -> None:
+        """Show a finished parse on the GUI thread."""
+        if parser is not self._parser:
+            return  # Superseded
+        self._parser = None
+        self._set_loading(None)
+
+        root, total, self._import_data = result
+        self._import_path = path
+        if total > PREVIEW_MAX_SESSIONS:
+            self._file_label.setText(
+                f"{path.name} (first {PREVIEW_MAX_SESSIONS:,} of {total:,} sessions shown)"
+            )
+        else:
             self._file_label.setText(path.name)
 
-            self._preview_tree.expandAll()
+        # One reset; the view only materializes the rows it paints. Large
+        # previews stay collapsed so only the folder rows are laid out.
+        self._preview_tree.setUpdatesEnabled(False)
+        try:
+            self._preview_model.set_root(root)
+            if total <= _PREVIEW_EXPAND_MAX:
+                self._preview_tree.expandRecursively(QModelIndex(), -1)
             for i in range(3):
                 self._preview_tree.resizeColumnToContents(i)
+        finally:
+            self._preview_tree.setUpdatesEnabled(True)
 
-            # Enable import button
-            self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(True)
-
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Load Failed",
-                f"Failed to load file:\n{e}"
-            )
-
-    def _load_csv_preview(self, path: Path) -> None:
-        """Load CSV file and populate preview."""
-        with open(path, newline='', encoding='utf-8-sig') as f:
-            sample = f.read(4096)
-            f.seek(0)
-
-            try:
-                dialect = csv.Sniffer().sniff(sample)
-            except csv.Error:
-                dialect = csv.excel
-
-            reader = csv.DictReader(f, dialect=dialect)
-            if reader.fieldnames:
-                reader.fieldnames = [h.lower().strip() for h in reader.fieldnames]
-
-            rows = list(reader)
-
-        self._import_data = rows
+        # Enable import button
+        self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(True)
 
-        # Column mappings
-        name_cols = ['name', 'display_name', 'session_name', 'device_name', 'device']
-        host_cols = ['hostname', 'host', 'ip', 'ip_address', 'address', 'mgmt_ip']
-        port_cols = ['port', 'ssh_port']
-        folder_cols = ['folder', 'folder_name', 'group', 'site', 'location']
-
-        def find_col(row: dict, candidates: list[str]) -> Optional[str]:
-            for col in candidates:
-                if col in row and row[col]:
-                    return row[col].strip()
-            return None
-
-        # Group by folder for preview
-        folder_items: dict[str, QTreeWidgetItem] = {}
-        root_sessions: list[QTreeWidgetItem] = []
-
-        for row in rows:
-            hostname = find_col(row, host_cols)
-            if not hostname:
-                continue
-
-            name = find_col(row, name_cols) or hostname
-            port = find_col(row, port_cols) or "22"
-            folder = find_col(row, folder_cols)
-
-            item = QTreeWidgetItem()
-            item.setText(0, name)
-            item.setText(1, hostname)
-            item.setText(2, port)
-
-            if folder:
-                if folder not in folder_items:
-                    folder_item = QTreeWidgetItem()
-                    folder_item.setText(0, f"📁 {folder}")
-                    self._preview_tree.addTopLevelItem(folder_item)
-                    folder_items[folder] = folder_item
-                folder_items[folder].addChild(item)
-            else:
-                root_sessions.append(item)
-
-        # Add ungrouped sessions at root
-        for item in root_sessions:
-            self._preview_tree.addTopLevelItem(item)
-
-    def _load_json_preview(self, path: Path) -> None:
-        """Load JSON file and populate preview."""
-        with open(path) as f:
-            data = json.load(f)
-
-        self._import_data = data
-
-        # Create folder items
-        folder_items: dict[int, QTreeWidgetItem] = {}
-        for folder_data in data.get("folders", []):
-            item = QTreeWidgetItem()
-            item.setText(0, f"📁 {folder_data['name']}")
-            folder_items[folder_data["id"]] = item
-
-        # Parent folders
-        for folder_data in data.get("folders", []):
-            item = folder_items[folder_data["id"]]
-            parent_id = folder_data.get("parent_id")
-            if parent_id and parent_id in folder_items:
-                folder_items[parent_id].addChild(item)
-            else:
-                self._preview_tree.addTopLevelItem(item)
-
-        # Add sessions
-        for session_data in data.get("sessions", []):
-            item = QTreeWidgetItem()
-            item.setText(0, session_data.get("name", ""))
-            item.setText(1, session_data.get("hostname", ""))
-            item.setText(2, str(session_data.get("port", 22)))
+    def _on_preview_failed(self, parser: _PreviewParser, error: str) -> None:
+        """Report a failed parse, keeping any previously loaded file."""
+        if parser is not self._parser:
+            return
+        self._parser = None
+        self._set_loading(None)
 
-            folder_id = session_data.get("folder_id")
-            if folder_id and folder_id in folder_items:
-                folder_items[folder_id].addChild(item)
-            else:
-                self._preview_tree.addTopLevelItem(item)
+        self._file_label.setText(
+            self._import_path.name if self._import_path else "No file selected"
+        )
+        self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(
+            self._import_path is not None
+        )
+        QMessageBox.critical(
+            self,
+            "Load Failed",
+            f"Failed to load file:\n{error}"
+        )
 
     def _on_import(self) -> None:
         """Perform import."""
@@ -803,7 +1252,8 @@ class ImportDialog(QDialog):
                 folders, imported, skipped = import_sessions_csv(
                     self.store,
                     self._import_path,
-                    merge=self._merge_check.isChecked()
+                    merge=self._merge_check.isChecked(),
+                    detect_dialect=self._detect_check.isChecked()
                 )
                 msg = f"Created {folders} folders.\nImported {imported} sessions."
             else:
@@ -836,6 +1286,7 @@ class ImportTerminalTelemetryDialog(QDialog):
         self.store = store
         self._import_path: Optional[Path] = None
         self._import_data: Optional[list] = None
+        self._parser: Optional[_PreviewParser] = None
 
         self.setWindowTitle("Import from TerminalTelemetry")
         self.setMinimumWidth(500)
@@ -855,9 +1306,9 @@ class ImportTerminalTelemetryDialog(QDialog):
         self._file_label = QLabel("No file selected")
         file_row.addWidget(self._file_label, 1)
 
-        browse_btn = QPushButton("Browse...")
-        browse_btn.clicked.connect(self._browse_file)
-        file_row.addWidget(browse_btn)
+        self._browse_btn = QPushButton("Browse...")
+        self._browse_btn.clicked.connect(self._browse_file)
+        file_row.addWidget(self._browse_btn)
 
         layout.addLayout(file_row)
 
@@ -910,20 +1361,41 @@ class ImportTerminalTelemetryDialog(QDialog):
             self._load_preview(Path(path))
 
     def _load_preview(self, path: Path) -> None:
-        """Load and preview the YAML file."""
-        try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
+        """Parse the YAML file in the thread pool, then show the preview."""
+        parser = _PreviewParser(_parse_tt_preview, path)
+        parser.signals.finished.connect(
+            lambda data: self._on_preview_parsed(parser, path, data)
+        )
+        parser.signals.failed.connect(
+            lambda error: self._on_preview_failed(parser, error)
+        )
+        self._parser = parser
+        self._set_loading(path)
+        QThreadPool.globalInstance().start(parser)
 
-            if not isinstance(data, list):
-                raise ValueError("Invalid format: expected list of folders")
+    def _set_loading(self, path: Optional[Path]) -> None:
+        """Lock the file controls while path is parsed; None unlocks them."""
+        busy = path is not None
+        self._browse_btn.setEnabled(not busy)
 
-            self._import_path = path
-            self._import_data = data
-            self._file_label.setText(path.name)
+        if busy:
+            self._file_label.setText(f"Loading {path.name}...")
+            self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
+            self.setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.unsetCursor()
 
-            # Build preview tree
-            self._preview_tree.clear()
+    def _on_preview_parsed(self, parser: _PreviewParser, path: Path, data: list) -> None:
+        """Build the preview items on the GUI thread."""
+        if parser is not self._parser:
+            return  # Superseded
+        self._parser = None
+        self._set_loading(None)
+
+        try:
+            # Build preview items detached from the tree, so children
+            # are added without the view reacting to each one
+            folder_items: list[QTreeWidgetItem] = []
 
             for folder_entry in data:
                 folder_name = folder_entry.get("folder_name", "Unknown")
@@ -934,7 +1406,7 @@ class ImportTerminalTelemetryDialog(QDialog):
                 folder_item.setText(0, f"📁 {folder_name}")
                 folder_item.setText(1, "")
                 folder_item.setText(2, f"{len(sessions)} sessions")
-                self._preview_tree.addTopLevelItem(folder_item)
+                folder_items.append(folder_item)
 
                 # Add sessions
                 for sess in sessions:
@@ -950,19 +1422,52 @@ class ImportTerminalTelemetryDialog(QDialog):
 
                     folder_item.addChild(item)
 
-            self._preview_tree.expandAll()
-            for i in range(3):
-                self._preview_tree.resizeColumnToContents(i)
+            # Swap the items in with repaints and sorting held off
+            tree = self._preview_tree
+            sorting = tree.isSortingEnabled()
+            tree.setUpdatesEnabled(False)
+            tree.setSortingEnabled(False)
+            try:
+                tree.clear()
+                tree.addTopLevelItems(folder_items)
+                tree.expandRecursively(QModelIndex(), -1)
+                for i in range(3):
+                    tree.resizeColumnToContents(i)
+            finally:
+                tree.setSortingEnabled(sorting)
+                tree.setUpdatesEnabled(True)
+
+            self._import_path = path
+            self._import_data = data
+            self._file_label.setText(path.name)
 
             # Enable import button
             self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(True)
 
         except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Load Failed",
-                f"Failed to load file:\n{e}"
-            )
+            self._show_load_error(str(e))
+
+    def _on_preview_failed(self, parser: _PreviewParser, error: str) -> None:
+        """Report a failed parse, keeping any previously loaded file."""
+        if parser is not self._parser:
+            return
+        self._parser = None
+        self._set_loading(None)
+        self._show_load_error(error)
+
+    def _show_load_error(self, error: str) -> None:
+        """Restore the previously loaded file's controls and report error."""
+        self._file_label.setText(
+            self._import_path.name if self._import_path else "No file selected"
+        )
+        self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(
+            self._import_path is not None
+        )
+        QMessageBox.critical(
+            self,
+            "Load Failed",
+            f"Failed to load file:\n{error}"
+        )
 
     def _on_import(self) -> None:
         """Perform import."""
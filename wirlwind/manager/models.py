@@ -3,19 +3,67 @@ Session manager data models and storage.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Iterable, Iterator, Optional
 from datetime import datetime
 import sqlite3
 import logging
+import threading
 import json
 
+_HAS_ORJSON = False
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    pass
+
 logger = logging.getLogger(__name__)
 
+# Full-text mirror of the searchable session columns. The trigram
+# tokenizer matches arbitrary substrings, as the LIKE search did, for
+# queries of at least three characters.
+_FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE sessions_fts USING fts5(
+        name, description, hostname,
+        content='sessions', content_rowid='id', tokenize='trigram'
+    );
+
+    CREATE TRIGGER sessions_fts_ai AFTER INSERT ON sessions BEGIN
+        INSERT INTO sessions_fts(rowid, name, description, hostname)
+        VALUES (new.id, new.name, new.description, new.hostname);
+    END;
+
+    CREATE TRIGGER sessions_fts_ad AFTER DELETE ON sessions BEGIN
+        INSERT INTO sessions_fts(sessions_fts, rowid, name, description, hostname)
+        VALUES ('delete', old.id, old.name, old.description, old.hostname);
+    END;
+
+    CREATE TRIGGER sessions_fts_au AFTER UPDATE OF name, description, hostname ON sessions BEGIN
+        INSERT INTO sessions_fts(sessions_fts, rowid, name, description, hostname)
+        VALUES ('delete', old.id, old.name, old.description, old.hostname);
+        INSERT INTO sessions_fts(rowid, name, description, hostname)
+        VALUES (new.id, new.name, new.description, new.hostname);
+    END;
+
+    INSERT INTO sessions_fts(sessions_fts) VALUES ('rebuild');
+"""
+
 # Default database location (alongside vault.db)
 DEFAULT_DB_PATH = Path.home() / ".wirlwind" / "sessions.db"
 
+# Session columns in SavedSession field order, so a row can be passed
+# to the constructor positionally
+_SESSION_COLUMNS = (
+    "id, name, description, hostname, port, credential_name, folder_id, "
+    "position, created_at, last_connected, connect_count, extras"
+)
+
+# Folder columns in SessionFolder field order
+_FOLDER_COLUMNS = "id, name, parent_id, position, expanded"
+
 
 @dataclass
 class SavedSession:
@@ -38,15 +86,55 @@ class SavedSession:
     last_connected: Optional[datetime] = None
     connect_count: int = 0
 
-    # Optional overrides (JSON-serialized extras)
+    # Optional overrides (JSON-serialized extras); a JSON string is kept
+    # as-is and decoded on first access (see the property below the class)
     extras: dict = field(default_factory=dict)
 
-    def __post_init__(self):
-        if isinstance(self.extras, str):
-            self.extras = json.loads(self.extras) if self.extras else {}
+    # Plain field defaults for _fast_new (filled in below the class)
+    _DEFAULTS: ClassVar[dict] = {}
 
+    @classmethod
+    def _fast_new(cls, **values) -> SavedSession:
+        """Build a session without the dataclass __init__, for bulk imports."""
+        obj = object.__new__(cls)
+        obj.__dict__.update(cls._DEFAULTS)
+        obj._extras = values.pop("extras", None) or {}
+        obj.__dict__.update(values)
+        return obj
 
-@dataclass
+
+def _get_extras(self: SavedSession) -> dict:
+    extras = self._extras
+    if isinstance(extras, str):
+        extras = self._extras = json.loads(extras) if extras else {}
+    return extras
+
+
+def _set_extras(self: SavedSession, extras) -> None:
+    self._extras = extras
+
+
+def _extras_json(session: SavedSession) -> str:
+    """extras as JSON text for the extras column."""
+    extras = session._extras
+    if isinstance(extras, str):
+        return extras or "{}"  # Never decoded: write back unchanged
+    if _HAS_ORJSON:
+        # Decoded so the column keeps TEXT storage rather than BLOB
+        return orjson.dumps(extras, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(extras)
+
+
+SavedSession._DEFAULTS = {
+    f.name: f.default for f in fields(SavedSession) if f.name != "extras"
+}
+
+# Installed after @dataclass so the field keeps its default_factory;
+# sessions listed for the tree never pay for decoding extras
+SavedSession.extras = property(_get_extras, _set_extras)
+
+
+@dataclass(slots=True)
 class SessionFolder:
     """A folder for organizing sessions."""
     id: Optional[int] = None
@@ -63,16 +151,60 @@ class SessionStore:
 
     def __init__(self, db_path: Path = None):
         self.db_path = db_path or DEFAULT_DB_PATH
-        self._conn: Optional[sqlite3.Connection] = None
+        # Per-thread connection and transaction() depth; every connection
+        # opened is also kept in _conns so close() can reach all of them
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        # Lowercased search columns (ids, names, descriptions, hostnames),
+        # built on first filter and dropped on any session edit
+        self._columns: Optional[tuple[list, list, list, list]] = None
         self._ensure_db()
 
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+        return conn
+
+    @property
+    def _tx_depth(self) -> int:
+        """Nesting depth of transaction() on this thread; commit only at 0."""
+        return getattr(self._local, "tx_depth", 0)
+
+    @_tx_depth.setter
+    def _tx_depth(self, depth: int) -> None:
+        self._local.tx_depth = depth
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection for the calling thread."""
+        # check_same_thread is off only so close() may shut connections
+        # owned by other threads; each thread otherwise uses its own
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+
+        # WAL with synchronous=NORMAL: one fsync per checkpoint rather than
+        # two per commit, and readers never block the writer
+        conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -20000;
+            PRAGMA mmap_size = 134217728;
+        """)
+
+        self._local.conn = conn
+        with self._conns_lock:
+            self._conns.append(conn)
+        return conn
+
     def _ensure_db(self) -> None:
         """Create database and tables if needed."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
+        conn = self._connect()
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS folders (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -97,18 +229,64 @@ class SessionStore:
                 extras TEXT DEFAULT '{}'
             );
             
-            CREATE INDEX IF NOT EXISTS idx_sessions_folder ON sessions(folder_id);
-            CREATE INDEX IF NOT EXISTS idx_folders_parent ON folders(parent_id);
+            -- Match the per-parent ORDER BY position, name listings so they
+            -- need no sort; these replace the earlier single-column indexes
+            CREATE INDEX IF NOT EXISTS idx_sessions_folder_pos
+                ON sessions(folder_id, position, name);
+            CREATE INDEX IF NOT EXISTS idx_folders_parent_pos
+                ON folders(parent_id, position, name);
+            DROP INDEX IF EXISTS idx_sessions_folder;
+            DROP INDEX IF EXISTS idx_folders_parent;
         """)
 
         conn.commit()
-        self._conn = conn
+
+        # Full-text index, created (and filled from existing rows) once;
+        # SQLite builds without FTS5 trigram support keep LIKE search
+        self._fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sessions_fts'"
+        ).fetchone() is not None
+        if not self._fts:
+            try:
+                conn.executescript("BEGIN;" + _FTS_SCHEMA + "COMMIT;")
+                self._fts = True
+            except sqlite3.OperationalError as e:
+                conn.rollback()
+                logger.info(f"Session full-text search unavailable: {e}")
 
     def close(self) -> None:
-        """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Close the database connections of all threads."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
+
+    def _commit(self) -> None:
+        """Commit now unless inside transaction()."""
+        if not self._tx_depth:
+            self._conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group writes into a single commit.
+
+        Store methods called inside the block skip their own commit; the
+        outermost block commits on success and rolls back on error.
+        """
+        self._tx_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._tx_depth -= 1
+            if not self._tx_depth:
+                self._conn.rollback()
+                self._columns = None
+            raise
+        self._tx_depth -= 1
+        if not self._tx_depth:
+            self._conn.commit()
 
     # -------------------------------------------------------------------------
     # Folder operations
@@ -126,13 +304,34 @@ class SessionStore:
             "INSERT INTO folders (name, parent_id, position) VALUES (?, ?, ?)",
             (name, parent_id, position)
         )
-        self._conn.commit()
+        self._commit()
         return cursor.lastrowid
 
+    def add_folders(self, names: Iterable[str], parent_id: int = None) -> list[int]:
+        """
+        Create several folders under one parent. Returns their IDs in order.
+
+        The next position is looked up once and all inserts share one commit.
+        """
+        position = self._conn.execute(
+            "SELECT COALESCE(MAX(position), -1) + 1 FROM folders WHERE parent_id IS ?",
+            (parent_id,)
+        ).fetchone()[0]
+
+        folder_ids = []
+        with self.transaction():
+            for position, name in enumerate(names, position):
+                cursor = self._conn.execute(
+                    "INSERT INTO folders (name, parent_id, position) VALUES (?, ?, ?)",
+                    (name, parent_id, position)
+                )
+                folder_ids.append(cursor.lastrowid)
+        return folder_ids
+
     def get_folder(self, folder_id: int) -> Optional[SessionFolder]:
         """Get folder by ID."""
         cursor = self._conn.execute(
-            "SELECT * FROM folders WHERE id = ?", (folder_id,)
+            f"SELECT {_FOLDER_COLUMNS} FROM folders WHERE id = ?", (folder_id,)
         )
         row = cursor.fetchone()
         return self._row_to_folder(row) if row else None
@@ -140,7 +339,7 @@ class SessionStore:
     def list_folders(self, parent_id: int = None) -> list[SessionFolder]:
         """List folders under a parent (None = root level)."""
         cursor = self._conn.execute(
-            "SELECT * FROM folders WHERE parent_id IS ? ORDER BY position, name",
+            f"SELECT {_FOLDER_COLUMNS} FROM folders WHERE parent_id IS ? ORDER BY position, name",
             (parent_id,)
         )
         return [self._row_to_folder(row) for row in cursor]
@@ -154,7 +353,7 @@ class SessionStore:
             (folder.name, folder.parent_id, folder.position,
              1 if folder.expanded else 0, folder.id)
         )
-        self._conn.commit()
+        self._commit()
         return True
 
     def delete_folder(self, folder_id: int) -> bool:
@@ -171,17 +370,17 @@ class SessionStore:
         )
         # Delete folder
         self._conn.execute("DELETE FROM folders WHERE id = ?", (folder_id,))
-        self._conn.commit()
+        self._commit()
         return True
 
+    def count_folders(self) -> int:
+        """Total number of folders."""
+        return self._conn.execute("SELECT COUNT(*) FROM folders").fetchone()[0]
+
     def _row_to_folder(self, row: sqlite3.Row) -> SessionFolder:
-        return SessionFolder(
-            id=row["id"],
-            name=row["name"],
-            parent_id=row["parent_id"],
-            position=row["position"],
-            expanded=bool(row["expanded"]),
-        )
+        # Rows are selected as _FOLDER_COLUMNS and unpacked by position
+        folder_id, name, parent_id, position, expanded = row
+        return SessionFolder(folder_id, name, parent_id, position, bool(expanded))
 
     # -------------------------------------------------------------------------
     # Session operations
@@ -201,15 +400,53 @@ class SessionStore:
                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
             (session.name, session.description, session.hostname, session.port,
              session.credential_name, session.folder_id, position,
-             json.dumps(session.extras))
+             _extras_json(session))
         )
-        self._conn.commit()
+        self._commit()
+        self._columns = None
         return cursor.lastrowid
 
+    def add_sessions(self, sessions: Iterable[SavedSession]) -> int:
+        """
+        Add many sessions with one executemany. Returns the number added.
+
+        Each session is appended to the end of its folder, as add_session
+        would do. Session ids are not filled in.
+        """
+        sessions = list(sessions)
+        if not sessions:
+            return 0
+
+        # Next free position of every folder, in one grouped query
+        next_position: dict[Optional[int], int] = dict(self._conn.execute(
+            "SELECT folder_id, COALESCE(MAX(position), -1) + 1 FROM sessions GROUP BY folder_id"
+        ).fetchall())
+
+        rows = []
+        for session in sessions:
+            folder_id = session.folder_id
+            position = next_position.get(folder_id, 0)
+            next_position[folder_id] = position + 1
+            rows.append(
+                (session.name, session.description, session.hostname, session.port,
+                 session.credential_name, folder_id, position,
+                 _extras_json(session))
+            )
+
+        self._conn.executemany(
+            """INSERT INTO sessions 
+               (name, description, hostname, port, credential_name, folder_id, position, extras)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            rows
+        )
+        self._commit()
+        self._columns = None
+        return len(rows)
+
     def get_session(self, session_id: int) -> Optional[SavedSession]:
         """Get session by ID."""
         cursor = self._conn.execute(
-            "SELECT * FROM sessions WHERE id = ?", (session_id,)
+            f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE id = ?", (session_id,)
         )
         row = cursor.fetchone()
         return self._row_to_session(row) if row else None
@@ -217,7 +454,7 @@ class SessionStore:
     def list_sessions(self, folder_id: int = None) -> list[SavedSession]:
         """List sessions in a folder (None = root level)."""
         cursor = self._conn.execute(
-            "SELECT * FROM sessions WHERE folder_id IS ? ORDER BY position, name",
+            f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE folder_id IS ? ORDER BY position, name",
             (folder_id,)
         )
         return [self._row_to_session(row) for row in cursor]
@@ -225,10 +462,14 @@ class SessionStore:
     def list_all_sessions(self) -> list[SavedSession]:
         """List all sessions regardless of folder."""
         cursor = self._conn.execute(
-            "SELECT * FROM sessions ORDER BY name"
+            f"SELECT {_SESSION_COLUMNS} FROM sessions ORDER BY name"
         )
         return [self._row_to_session(row) for row in cursor]
 
+    def count_sessions(self) -> int:
+        """Total number of sessions."""
+        return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
     def update_session(self, session: SavedSession) -> bool:
         """Update session properties."""
         self._conn.execute(
@@ -238,15 +479,17 @@ class SessionStore:
                WHERE id = ?""",
             (session.name, session.description, session.hostname, session.port,
              session.credential_name, session.folder_id, session.position,
-             json.dumps(session.extras), session.id)
+             _extras_json(session), session.id)
         )
-        self._conn.commit()
+        self._commit()
+        self._columns = None
         return True
 
     def delete_session(self, session_id: int) -> bool:
         """Delete a session."""
         self._conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
-        self._conn.commit()
+        self._commit()
+        self._columns = None
         return True
 
     def record_connect(self, session_id: int) -> None:
@@ -257,34 +500,67 @@ class SessionStore:
                WHERE id = ?""",
             (session_id,)
         )
-        self._conn.commit()
+        self._commit()
 
     def search_sessions(self, query: str) -> list[SavedSession]:
         """Search sessions by name, description, or hostname."""
+        if self._fts and len(query) >= 3:
+            # Quoted as one FTS string: trigram matches it as a substring
+            phrase = '"' + query.replace('"', '""') + '"'
+            cursor = self._conn.execute(
+                f"""SELECT {_SESSION_COLUMNS} FROM sessions
+                    WHERE id IN (SELECT rowid FROM sessions_fts WHERE sessions_fts MATCH ?)
+                    ORDER BY name""",
+                (phrase,)
+            )
+            return [self._row_to_session(row) for row in cursor]
+
         pattern = f"%{query}%"
         cursor = self._conn.execute(
-            """SELECT * FROM sessions 
-               WHERE name LIKE ? OR description LIKE ? OR hostname LIKE ?
-               ORDER BY name""",
+            f"""SELECT {_SESSION_COLUMNS} FROM sessions
+                WHERE name LIKE ? OR description LIKE ? OR hostname LIKE ?
+                ORDER BY name""",
             (pattern, pattern, pattern)
         )
         return [self._row_to_session(row) for row in cursor]
 
+    def match_session_ids(self, query: str) -> set[int]:
+        """
+        IDs of sessions whose name, description, or hostname contains
+        query (case-insensitive).
+
+        Scans in-memory column lists instead of loading a SavedSession
+        per row — the tree filter calls this on every keystroke.
+        """
+        if self._columns is None:
+            ids, names, descriptions, hostnames = [], [], [], []
+            cursor = self._conn.execute(
+                "SELECT id, name, description, hostname FROM sessions"
+            )
+            for row in cursor:
+                ids.append(row[0])
+                names.append((row[1] or "").lower())
+                descriptions.append((row[2] or "").lower())
+                hostnames.append((row[3] or "").lower())
+            self._columns = (ids, names, descriptions, hostnames)
+
+        query = query.lower()
+        ids, names, descriptions, hostnames = self._columns
+        return {
+            session_id
+            for session_id, name, description, hostname
+            in zip(ids, names, descriptions, hostnames)
+            if query in name or query in description or query in hostname
+        }
+
+    def invalidate_columns(self) -> None:
+        """Drop the cached search columns (after editing the db directly)."""
+        self._columns = None
+
     def _row_to_session(self, row: sqlite3.Row) -> SavedSession:
-        return SavedSession(
-            id=row["id"],
-            name=row["name"],
-            description=row["description"],
-            hostname=row["hostname"],
-            port=row["port"],
-            credential_name=row["credential_name"],
-            folder_id=row["folder_id"],
-            position=row["position"],
-            created_at=row["created_at"],
-            last_connected=row["last_connected"],
-            connect_count=row["connect_count"],
-            extras=row["extras"],
-        )
+        # Rows are selected as _SESSION_COLUMNS; positional construction
+        # skips a by-name column scan per field
+        return SavedSession(*row)
 
     # -------------------------------------------------------------------------
     # Bulk / tree operations
@@ -298,12 +574,25 @@ class SessionStore:
             - folders: list of SessionFolder (all)
             - sessions: list of SavedSession (all)
         """
+        # One round trip: folders ordered by position, name, then sessions
+        # by name. Folder rows are padded to the session column count.
+        cursor = self._conn.execute(
+            f"""SELECT 'f' AS kind, position AS sort_pos, {_FOLDER_COLUMNS},
+                      NULL, NULL, NULL, NULL, NULL, NULL, NULL
+               FROM folders
+               UNION ALL
+               SELECT 's', 0, {_SESSION_COLUMNS}
+               FROM sessions
+               ORDER BY kind, sort_pos, name"""
+        )
+
         folders = []
-        cursor = self._conn.execute("SELECT * FROM folders ORDER BY position, name")
+        sessions = []
         for row in cursor:
-            folders.append(self._row_to_folder(row))
-
-        sessions = self.list_all_sessions()
+            if row[0] == "f":
+                folders.append(self._row_to_folder(row[2:7]))
+            else:
+                sessions.append(SavedSession(*row[2:]))
 
         return {"folders": folders, "sessions": sessions}
 
@@ -320,18 +609,26 @@ class SessionStore:
             "UPDATE sessions SET folder_id = ?, position = ? WHERE id = ?",
             (folder_id, position, session_id)
         )
-        self._conn.commit()
+        self._commit()
 
     def move_folder(self, folder_id: int, parent_id: int = None) -> None:
         """Move folder to a different parent."""
-        # Prevent circular reference
+        # Prevent circular reference: folder_id must not be parent_id or
+        # any of its ancestors (UNION also stops on an existing cycle)
         if parent_id:
-            current = parent_id
-            while current:
-                if current == folder_id:
-                    raise ValueError("Cannot move folder into itself")
-                folder = self.get_folder(current)
-                current = folder.parent_id if folder else None
+            cursor = self._conn.execute(
+                """WITH RECURSIVE ancestors(id) AS (
+                       SELECT ?
+                       UNION
+                       SELECT f.parent_id FROM folders f
+                       JOIN ancestors a ON f.id = a.id
+                       WHERE f.parent_id IS NOT NULL
+                   )
+                   SELECT 1 FROM ancestors WHERE id = ? LIMIT 1""",
+                (parent_id, folder_id)
+            )
+            if cursor.fetchone():
+                raise ValueError("Cannot move folder into itself")
 
         cursor = self._conn.execute(
             "SELECT COALESCE(MAX(position), -1) + 1 FROM folders WHERE parent_id IS ?",
@@ -343,4 +640,4 @@ class SessionStore:
             "UPDATE folders SET parent_id = ?, position = ? WHERE id = ?",
             (parent_id, position, folder_id)
         )
-        self._conn.commit()
\ No newline at end of file
+        self._commit()
\ No newline at end of file
@@ -3,90 +3,170 @@ Settings dialog with theme selection and persistence.
 """
 
 from __future__ import annotations
+import copy
+import threading
 from typing import Optional
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QComboBox, QSpinBox, QPushButton,
     QDialogButtonBox, QGroupBox, QLabel, QWidget,
-    QFrame, QCheckBox
+    QFrame, QCheckBox, QMessageBox
 )
-from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QSignalBlocker, QObject, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import QFont, QStandardItem, QStandardItemModel
 
 from wirlwind.theme.engine import ThemeEngine, Theme
 from wirlwind.config import get_settings, save_settings, AppSettings
 
+# (terminal color, fallback) for each preview swatch, left to right
+_PREVIEW_KEYS = (
+    ("red", "#f38ba8"),
+    ("green", "#a6e3a1"),
+    ("yellow", "#f9e2af"),
+    ("blue", "#89b4fa"),
+    ("magenta", "#f5c2e7"),
+    ("cyan", "#94e2d5"),
+)
+
+# ThemePreview stylesheet pieces, filled with format_map on a cache miss
+_FRAME_TEMPLATE = """
+            ThemePreview {{
+                background-color: {bg};
+                border: 1px solid {border};
+                border-radius: 4px;
+            }}
+            QLabel#sample {{
+                color: {fg};
+                background: transparent;
+            }}
+        """
+_SWATCH_TEMPLATE = "QFrame#sw{i} {{ background-color: {color}; border-radius: 2px; }}\n"
+
+# Settings shown in the "Terminal Behavior" group
+_BEHAVIOR_KEYS = frozenset({
+    "multiline_paste_threshold", "scrollback_lines", "auto_reconnect"
+})
+
+# save_settings() serializes the shared settings object from the pool,
+# so it runs under this lock and the GUI thread takes the lock whenever
+# it changes that object; a save never sees a half-applied update
+_save_lock = threading.Lock()
+
+
+class _SettingsSaverSignals(QObject):
+    finished = pyqtSignal(str)  # error message, "" on success
+
+
+class _SettingsSaver(QRunnable):
+    """Persists the shared settings in the thread pool."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _SettingsSaverSignals()
+
+    def run(self):
+        try:
+            with _save_lock:
+                save_settings()
+        except Exception as e:
+            self.signals.finished.emit(str(e) or repr(e))
+        else:
+            self.signals.finished.emit("")
+
 
 class ThemePreview(QFrame):
     """Small preview of theme colors."""
 
+    # Stylesheet strings keyed by the colors they embed, shared by all
+    # previews so flipping back to a theme reuses the same strings
+    _SHEET_CACHE: dict[tuple[str, ...], str] = {}
+
+    # Sample fonts keyed by (theme font_family, size)
+    _FONT_CACHE: dict[tuple[str, int], QFont] = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(60)
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Sunken)
         self._theme: Optional[Theme] = None
+        self._sample_label: Optional[QLabel] = None
+        self._swatches: list[QFrame] = []
         self._update_style()
 
     def set_theme(self, theme: Theme) -> None:
         """Update preview with theme colors."""
+        if self._theme is not None and getattr(theme, "name", None) == self._theme.name:
+            return  # Already showing this theme
         self._theme = theme
         self._update_style()
 
+    @classmethod
+    def _sheet(cls, bg: str, border: str, fg: str, swatch_colors: tuple[str, ...]) -> str:
+        """One stylesheet for the frame, sample label and every swatch."""
+        key = (bg, border, fg) + swatch_colors
+        sheet = cls._SHEET_CACHE.get(key)
+        if sheet is None:
+            sheet = _FRAME_TEMPLATE.format_map({"bg": bg, "border": border, "fg": fg})
+            sheet += "".join(
+                _SWATCH_TEMPLATE.format_map({"i": i, "color": color})
+                for i, color in enumerate(swatch_colors)
+            )
+            cls._SHEET_CACHE[key] = sheet
+        return sheet
+
+    @classmethod
+    def _font(cls, font_family: str, size: int) -> QFont:
+        """QFont for the first family in a CSS-style font list."""
+        key = (font_family, size)
+        font = cls._FONT_CACHE.get(key)
+        if font is None:
+            font = cls._FONT_CACHE[key] = QFont(font_family.split(",")[0].strip(), size)
+        return font
+
     def _update_style(self) -> None:
         if not self._theme:
             return
-
-        colors = self._theme.terminal_colors
-        bg = colors.get("background", "#1e1e2e")
-        fg = colors.get("foreground", "#cdd6f4")
-
-        # Build color swatches
-        swatch_colors = [
-            colors.get("red", "#f38ba8"),
-            colors.get("green", "#a6e3a1"),
-            colors.get("yellow", "#f9e2af"),
-            colors.get("blue", "#89b4fa"),
-            colors.get("magenta", "#f5c2e7"),
-            colors.get("cyan", "#94e2d5"),
-        ]
-
-        self.setStyleSheet(f"""
-            ThemePreview {{
-                background-color: {bg};
-                border: 1px solid {self._theme.border_color};
-                border-radius: 4px;
-            }}
-        """)
-
-        # Clear existing widgets
-        if self.layout():
-            while self.layout().count():
-                child = self.layout().takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-        else:
-            layout = QHBoxLayout(self)
-            layout.setContentsMargins(8, 8, 8, 8)
-            layout.setSpacing(4)
+        if self.layout() is None:
+            self._build_once()
+        # Sample label, stretch and swatches are never rebuilt
+        assert self.layout().count() == len(_PREVIEW_KEYS) + 2
+        self._apply_theme()
+
+    def _build_once(self) -> None:
+        """Create the sample label and swatches; themes only restyle them."""
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(4)
 
         # Add sample text
-        sample = QLabel("user@host:~$")
-        sample.setStyleSheet(f"color: {fg}; background: transparent;")
-        sample.setFont(QFont(self._theme.font_family.split(",")[0].strip(), 11))
-        self.layout().addWidget(sample)
+        self._sample_label = QLabel("user@host:~$")
+        self._sample_label.setObjectName("sample")
+        layout.addWidget(self._sample_label)
 
-        self.layout().addStretch()
+        layout.addStretch()
 
         # Add color swatches
-        for color in swatch_colors:
+        for i in range(len(_PREVIEW_KEYS)):
             swatch = QFrame()
+            swatch.setObjectName(f"sw{i}")
             swatch.setFixedSize(16, 16)
-            swatch.setStyleSheet(f"""
-                background-color: {color};
-                border-radius: 2px;
-            """)
-            self.layout().addWidget(swatch)
+            layout.addWidget(swatch)
+            self._swatches.append(swatch)
+
+    def _apply_theme(self) -> None:
+        """Restyle the existing widgets for the current theme with one sheet."""
+        colors = self._theme.terminal_colors
+        bg = colors.get("background", "#1e1e2e")
+        fg = colors.get("foreground", "#cdd6f4")
+
+        # Build color swatches
+        swatch_colors = tuple(colors.get(key, default) for key, default in _PREVIEW_KEYS)
+
+        self.setStyleSheet(self._sheet(bg, self._theme.border_color, fg, swatch_colors))
+        self._sample_label.setFont(self._font(self._theme.font_family, 11))
 
 
 class SettingsDialog(QDialog):
@@ -101,6 +181,10 @@ class SettingsDialog(QDialog):
     theme_changed = pyqtSignal(object)  # Theme
     settings_changed = pyqtSignal(object)  # AppSettings
 
+    # (display name, theme name) pairs, rebuilt only when the theme list changes
+    _THEME_NAMES: tuple[str, ...] = ()
+    _THEME_ITEMS: tuple[tuple[str, str], ...] = ()
+
     def __init__(
             self,
             theme_engine: ThemeEngine,
@@ -112,7 +196,23 @@ class SettingsDialog(QDialog):
         self._settings = get_settings()
         self._current_theme = current_theme or theme_engine.current
         self._original_theme = self._current_theme
-        self._original_settings = AppSettings.from_dict(self._settings.to_dict())
+        self._original_settings = copy.copy(self._settings)
+        self._saver: Optional[_SettingsSaver] = None
+        self._theme_cache: dict[str, Theme] = {}
+        # Settings as last loaded into the form; None forces a full reload
+        self._loaded_settings: Optional[dict] = None
+
+        # Back-to-back Applies share one trailing write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._save_in_background)
+
+        # Collapse rapid combo navigation into one preview update
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self._apply_pending_theme)
 
         self._setup_ui()
         self._load_settings()
@@ -133,16 +233,18 @@ class SettingsDialog(QDialog):
         selector_row.addWidget(QLabel("Theme:"))
 
         self._theme_combo = QComboBox()
-        for name in self.theme_engine.list_themes():
-            self._theme_combo.addItem(name.replace("_", " ").title(), name)
+        self._populate_theme_combo()
         self._theme_combo.currentIndexChanged.connect(self._on_theme_changed)
         selector_row.addWidget(self._theme_combo, 1)
 
         theme_layout.addLayout(selector_row)
 
-        # Theme preview
-        self._preview = ThemePreview()
-        theme_layout.addWidget(self._preview)
+        # Theme preview, built on first show (see _build_preview)
+        self._theme_layout = theme_layout
+        self._preview: Optional[ThemePreview] = None
+        self._preview_placeholder = QWidget()
+        self._preview_placeholder.setFixedHeight(60)
+        theme_layout.addWidget(self._preview_placeholder)
 
         layout.addWidget(theme_group)
 
@@ -197,51 +299,210 @@ class SettingsDialog(QDialog):
         buttons.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self._apply)
         layout.addWidget(buttons)
 
+    def showEvent(self, event) -> None:
+        # Settings may have changed elsewhere while the dialog was hidden
+        self._reload_changed_settings()
+        self._build_preview()
+        super().showEvent(event)
+
+    def _build_preview(self) -> None:
+        """Swap the placeholder for the real theme preview."""
+        if self._preview is not None:
+            return
+        self._preview = ThemePreview()
+        self._theme_layout.replaceWidget(self._preview_placeholder, self._preview)
+        self._preview_placeholder.deleteLater()
+        self._preview_placeholder = None
+        self._preview.set_theme(self._current_theme)
+
+    def _theme_items(self) -> tuple[tuple[str, str], ...]:
+        """Combo entries for the engine's themes, cached across dialogs."""
+        names = tuple(self.theme_engine.list_themes())
+        cls = type(self)
+        if names != cls._THEME_NAMES:
+            cls._THEME_NAMES = names
+            cls._THEME_ITEMS = tuple(
+                (name.replace("_", " ").title(), name) for name in names
+            )
+        return cls._THEME_ITEMS
+
+    def _populate_theme_combo(self) -> None:
+        """Fill the theme combo from one prebuilt model."""
+        model = QStandardItemModel(self._theme_combo)
+        items = []
+        self._theme_row: dict[str, int] = {}
+        for row, (label, name) in enumerate(self._theme_items()):
+            self._theme_row[name] = row
+            item = QStandardItem(label)
+            item.setData(name, Qt.ItemDataRole.UserRole)
+            item.setEditable(False)
+            items.append(item)
+        if items:
+            model.appendColumn(items)
+
+        with QSignalBlocker(self._theme_combo):
+            self._theme_combo.setModel(model)
+
     def _load_settings(self) -> None:
         """Load current settings into form."""
-        # Select current theme
-        idx = self._theme_combo.findData(self._settings.theme_name)
-        if idx >= 0:
-            self._theme_combo.setCurrentIndex(idx)
+        self._load_theme()
+        self._load_font()
+        self._load_behavior()
+        self._loaded_settings = self._settings.to_dict()
+
+    def _reload_changed_settings(self) -> None:
+        """Reload only the form sections whose settings changed since the last load."""
+        if self._loaded_settings is None:
+            self._load_settings()
         else:
-            # Fallback to current theme
-            idx = self._theme_combo.findData(self._current_theme.name)
+            current = self._settings.to_dict()
+            changed = {key for key, value in current.items()
+                       if self._loaded_settings.get(key) != value}
+            if not changed:
+                return
+
+            if "theme_name" in changed:
+                self._load_theme()
+            if "font_size" in changed:
+                self._load_font()
+            if changed & _BEHAVIOR_KEYS:
+                self._load_behavior()
+            self._loaded_settings = current
+
+        # Dirty checks in _apply compare against what the form now shows
+        self._original_settings = copy.copy(self._settings)
+
+    def _load_theme(self) -> None:
+        """Select the saved theme and preview it."""
+        # Select silently; the preview is updated once below
+        with QSignalBlocker(self._theme_combo):
+            # Select current theme, falling back to the engine's
+            idx = self._theme_row.get(
+                self._settings.theme_name,
+                self._theme_row.get(self._current_theme.name, -1)
+            )
             if idx >= 0:
                 self._theme_combo.setCurrentIndex(idx)
 
-        self._preview.set_theme(self._current_theme)
-        self._font_size_spin.setValue(self._settings.font_size)
-        self._multiline_spin.setValue(self._settings.multiline_paste_threshold)
-        self._scrollback_spin.setValue(self._settings.scrollback_lines)
-        self._auto_reconnect_check.setChecked(self._settings.auto_reconnect)
+        self._apply_pending_theme()
+        if self._preview:
+            self._preview.set_theme(self._current_theme)
+
+    def _load_font(self) -> None:
+        with QSignalBlocker(self._font_size_spin):
+            self._font_size_spin.setValue(self._settings.font_size)
+
+    def _load_behavior(self) -> None:
+        with QSignalBlocker(self._multiline_spin), \
+                QSignalBlocker(self._scrollback_spin), \
+                QSignalBlocker(self._auto_reconnect_check):
+            self._multiline_spin.setValue(self._settings.multiline_paste_threshold)
+            self._scrollback_spin.setValue(self._settings.scrollback_lines)
+            self._auto_reconnect_check.setChecked(self._settings.auto_reconnect)
 
     def _on_theme_changed(self, index: int) -> None:
-        """Handle theme selection change."""
+        """Handle theme selection change; the preview follows after a pause."""
+        self._preview_timer.start()
+
+    def _apply_pending_theme(self) -> None:
+        """Show the theme now selected in the combo."""
         theme_name = self._theme_combo.currentData()
-        theme = self.theme_engine.get_theme(theme_name)
+        if theme_name == self._current_theme.name:
+            return
+        theme = self._theme_cache.get(theme_name)
+        if theme is None:
+            theme = self.theme_engine.get_theme(theme_name)
+            if theme:
+                self._theme_cache[theme_name] = theme
         if theme:
             self._current_theme = theme
-            self._preview.set_theme(theme)
+            if self._preview:
+                self._preview.set_theme(theme)
+
+    def _flush_pending_theme(self) -> None:
+        """Apply a selection still waiting on the preview timer."""
+        if self._preview_timer.isActive():
+            self._preview_timer.stop()
+            self._apply_pending_theme()
 
     def _apply(self) -> None:
         """Apply current settings and persist."""
+        self._flush_pending_theme()
+        font_size = self._font_size_spin.value()
+        theme_dirty = (
+            self._current_theme is not self.theme_engine.current
+            or self._current_theme.font_size != font_size
+        )
+
+        # Read the form first so the lock is held only for the assignments
+        theme_name = self._theme_combo.currentData()
+        multiline = self._multiline_spin.value()
+        scrollback = self._scrollback_spin.value()
+        auto_reconnect = self._auto_reconnect_check.isChecked()
+
         # Update settings object
-        self._settings.theme_name = self._theme_combo.currentData()
-        self._settings.font_size = self._font_size_spin.value()
-        self._settings.multiline_paste_threshold = self._multiline_spin.value()
-        self._settings.scrollback_lines = self._scrollback_spin.value()
-        self._settings.auto_reconnect = self._auto_reconnect_check.isChecked()
+        with _save_lock:
+            self._settings.theme_name = theme_name
+            self._settings.font_size = font_size
+            self._settings.multiline_paste_threshold = multiline
+            self._settings.scrollback_lines = scrollback
+            self._settings.auto_reconnect = auto_reconnect
 
         # Update font size on theme
-        self._current_theme.font_size = self._font_size_spin.value()
+        self._current_theme.font_size = font_size
         self.theme_engine.current = self._current_theme
+        # Cancel after Apply keeps what was applied
+        self._original_theme = self._current_theme
 
-        # Save to disk
-        save_settings()
+        # Save to disk only when something differs from what is stored
+        settings = self._settings.to_dict()
+        self._loaded_settings = settings  # The form now matches
+        settings_dirty = settings != self._original_settings.to_dict()
+        if settings_dirty:
+            self._save_timer.start()
+            self._original_settings = copy.copy(self._settings)
 
         # Emit signals
-        self.theme_changed.emit(self._current_theme)
-        self.settings_changed.emit(self._settings)
+        if theme_dirty:
+            self.theme_changed.emit(self._current_theme)
+        if settings_dirty:
+            self.settings_changed.emit(self._settings)
+
+    def _save_in_background(self) -> None:
+        """Write settings to disk without blocking the dialog."""
+        # Each Apply updates the fields under _save_lock and queues its
+        # own save, so the last save to run sees the final values
+        self._saver = _SettingsSaver()
+        self._saver.signals.finished.connect(self._on_settings_saved)
+        QThreadPool.globalInstance().start(self._saver)
+
+    def _flush_save(self) -> None:
+        """Write a save still waiting on the timer before returning."""
+        if not self._save_timer.isActive():
+            return
+        self._save_timer.stop()
+        saver = _SettingsSaver()
+        saver.signals.finished.connect(self._on_settings_saved)
+        saver.run()
+
+    def _on_settings_saved(self, error: str) -> None:
+        """Report a failed background save."""
+        if error:
+            QMessageBox.warning(
+                self,
+                "Save Failed",
+                f"Failed to save settings:\n{error}"
+            )
+
+    def done(self, result: int) -> None:
+        # Closing by any route persists what was applied
+        self._flush_save()
+        # Themes may be reloaded before the dialog is shown again
+        self._theme_cache.clear()
+        if result == QDialog.DialogCode.Rejected:
+            # The form may hold discarded edits
+            self._loaded_settings = None
+        super().done(result)
 
     def _on_accept(self) -> None:
         """Accept and close."""
@@ -250,7 +511,8 @@ class SettingsDialog(QDialog):
 
     def _on_reject(self) -> None:
         """Cancel - revert to original theme."""
-        if self._current_theme != self._original_theme:
+        # Previewing never touches the engine, so only restore if it moved
+        if self.theme_engine.current is not self._original_theme:
             self.theme_engine.current = self._original_theme
             self.theme_changed.emit(self._original_theme)
         self.reject()
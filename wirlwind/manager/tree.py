@@ -338,23 +338,17 @@ class SessionTreeWidget(QWidget):
                 item.setHidden(False)
             return
         
+        matched_ids = self.store.match_session_ids(query)
+
         # Hide non-matching items, but show folders with matching children
         def process_item(item) -> bool:
             """Returns True if item or any child matches."""
             item_type = item.data(0, ROLE_ITEM_TYPE)
             
             if item_type == ItemType.SESSION:
-                session_id = item.data(0, ROLE_ITEM_ID)
-                session = self.store.get_session(session_id)
-                if session:
-                    matches = (
-                        query in session.name.lower() or
-                        query in session.description.lower() or
-                        query in session.hostname.lower()
-                    )
-                    item.setHidden(not matches)
-                    return matches
-                return False
+                matches = item.data(0, ROLE_ITEM_ID) in matched_ids
+                item.setHidden(not matches)
+                return matches
             
             elif item_type == ItemType.FOLDER:
                 # Check all children
@@ -1,11 +1,12 @@
 """
 Parser Chain — Ordered fallback parser for CLI output.
 
-TextFSM → TTP → Regex fallback.
+TextFSM → TTP → Columns / WS table → Regex fallback.
 First parser that returns valid structured data wins.
 
 Each result carries metadata:
-    _parsed_by:  "textfsm" | "ttp" | "regex" | "none"
+    _parsed_by:  "builtin" | "textfsm" | "ttp" | "columns" | "ws_table" |
+                 "regex" | "none"
     _template:   template filename or "inline"
     _error:      error message (only on failure)
 
@@ -13,6 +14,9 @@ The chain now accepts an optional ParseTrace object for structured
 audit logging. Every template tried, every resolution attempt, every
 failure reason is recorded.
 
+Commands with a built-in parser (see _FAST_PARSERS) skip the chain
+entirely unless the collection sets `fast_path: false`.
+
 Collection config (YAML):
     command: "show ip interface brief"
     interval: 60
@@ -26,6 +30,10 @@ Collection config (YAML):
       - type: ttp
         templates:
           - cisco_ios_show_ip_interface_brief.ttp
+      - type: columns
+        header: "Interface"           # data starts after this line
+        columns: [intf, ipaddr, ~, ~, status, proto]
+        merge_column: status          # absorbs extra tokens
       - type: regex
         pattern: '^(\\S+)\\s+...'
         flags: MULTILINE
@@ -40,8 +48,10 @@ Collection config (YAML):
 from __future__ import annotations
 import re
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .parse_trace import ParseTrace
@@ -52,6 +62,8 @@ logger = logging.getLogger(__name__)
 
 _HAS_TEXTFSM = False
 _HAS_TTP = False
+_HAS_RE2 = False
+_HAS_HYPERSCAN = False
 
 try:
     import textfsm
@@ -65,17 +77,56 @@ try:
 except ImportError:
     logger.info("ttp not installed — TTP parser unavailable")
 
+try:
+    import re2
+    _HAS_RE2 = True
+except ImportError:
+    logger.info("re2 not installed — inline regex uses stdlib re")
+
+try:
+    import hyperscan
+    _HAS_HYPERSCAN = True
+except ImportError:
+    logger.info("hyperscan not installed — regex prefilter unavailable")
+
 
 # ── Metadata helper ────────────────────────────────────────────────
 
-def _meta(parsed_by: str, template: str = "inline", error: str = None) -> dict:
-    """Build parser metadata dict."""
-    m = {"_parsed_by": parsed_by, "_template": template}
+# Success metadata is the same handful of (parser, template) pairs on
+# every poll, so each is built once and shared read-only.
+_SUCCESS_META: dict[tuple[str, str], Mapping[str, str]] = {}
+
+
+def _meta(
+    parsed_by: str, template: str = "inline", error: str = None
+) -> Mapping[str, str]:
+    """
+    Build parser metadata.
+
+    Returns a shared read-only mapping for successes; failures get a
+    fresh dict carrying the error detail. Callers must not mutate it.
+    """
     if error:
-        m["_error"] = error
+        return {"_parsed_by": parsed_by, "_template": template, "_error": error}
+    key = (parsed_by, template)
+    m = _SUCCESS_META.get(key)
+    if m is None:
+        m = _SUCCESS_META[key] = MappingProxyType(
+            {"_parsed_by": parsed_by, "_template": template}
+        )
     return m
 
 
+_META_EMPTY_OUTPUT = MappingProxyType(
+    {"_parsed_by": "none", "_template": "inline", "_error": "empty output"}
+)
+_META_NO_PARSERS = MappingProxyType({
+    "_parsed_by": "none",
+    "_template": "inline",
+    "_error": "all parsers failed (no parsers defined)",
+})
+
+
 # ── CLI output sanitizer ──────────────────────────────────────────
 
 def _sanitize_cli_output(
@@ -201,6 +252,178 @@ def _parse_ttp(raw: str, template_path: Path) -> tuple[list[dict] | None, str]:
         return None, f"parse exception: {e}"
 
 
+_REGEX_FLAGS = {
+    "MULTILINE": re.MULTILINE,
+    "DOTALL": re.DOTALL,
+    "IGNORECASE": re.IGNORECASE,
+}
+
+
+_INLINE_FLAG_CHARS = {
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+    re.IGNORECASE: "i",
+}
+
+
+def _parse_flags(flags_str: str) -> int:
+    """Convert a config flags string ("MULTILINE|DOTALL") to re flags."""
+    flags = 0
+    for flag_name in (flags_str or "").replace("|", ",").replace(" ", ",").split(","):
+        flags |= _REGEX_FLAGS.get(flag_name.strip().upper(), 0)
+    return flags
+
+
+@lru_cache(maxsize=4096)
+def _compile_pattern(pattern: str, flags_str: str = ""):
+    """
+    Compile an inline regex pattern with config-style flags.
+
+    Flags come from YAML as a string ("MULTILINE", "MULTILINE|DOTALL",
+    "DOTALL, IGNORECASE"). Compiled patterns are cached by
+    (pattern, flags_str) so steady-state polling never recompiles —
+    the stdlib re cache is only 512 entries and is shared with every
+    other module in the process.
+
+    When google-re2 is installed, patterns compile to RE2 first (linear
+    time, no backtracking on long tables). RE2 rejects backreferences
+    and lookaround, so anything it can't handle falls back to stdlib re.
+
+    Raises re.error on a bad pattern (not cached).
+    """
+    flags = _parse_flags(flags_str)
+
+    if _HAS_RE2:
+        inline = "".join(c for f, c in _INLINE_FLAG_CHARS.items() if flags & f)
+        try:
+            return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+        except Exception as e:
+            logger.debug(f"re2 rejected pattern, using stdlib re: {e}")
+
+    return re.compile(pattern, flags)
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """True if pattern contains a "|" outside any group or character class."""
+    depth = 0
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "\\":
+            i += 1
+        elif c == "[":
+            # Skip the class; a leading "^" and "]" are part of it
+            i += 1
+            if i < n and pattern[i] == "^":
+                i += 1
+            if i < n and pattern[i] == "]":
+                i += 1
+            while i < n and pattern[i] != "]":
+                if pattern[i] == "\\":
+                    i += 1
+                i += 1
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _is_line_anchored(pattern: str, flags_str: str = "") -> bool:
+    """
+    True if a pattern describes exactly one line of output.
+
+    MULTILINE patterns wrapped in ^...$ (the table-row shape used by
+    interface and BGP fallbacks) can be matched line by line with an
+    anchored match() instead of letting finditer() scan every
+    character position — once a line fails, the engine moves straight
+    to the next one. DOTALL patterns, anything mentioning a newline, and
+    top-level alternations ("^a|b$" anchors only one end of each branch)
+    keep the finditer() path.
+    """
+    flags = _parse_flags(flags_str)
+    return (
+        bool(flags & re.MULTILINE)
+        and not flags & re.DOTALL
+        and pattern.startswith("^")
+        and pattern.endswith("$")
+        and not pattern.endswith("\\$")
+        and "\\n" not in pattern
+        and "\n" not in pattern
+        and not _has_top_level_alternation(pattern)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _regex_extractor(pattern: str, flags_str: str, groups: tuple):
+    """
+    Build a rows-from-text function specialized for one regex parser.
+
+    Everything that doesn't depend on the output — the compiled
+    pattern, line-anchored vs. finditer scanning, which groups map to
+    which fields, and whether they're valid — is decided once here and
+    bound into a closure as default arguments (fast locals). Cached by
+    (pattern, flags_str, groups) rather than stored on the config dict,
+    so configs stay plain YAML data.
+
+    groups is the config's group map as a tuple of (field, index) pairs.
+    Raises re.error on a bad pattern.
+    """
+    compiled = _compile_pattern(pattern, flags_str)
+
+    if _is_line_anchored(pattern, flags_str):
+        def scan(raw, _match=compiled.match):
+            return [m for m in map(_match, raw.split("\n")) if m]
+    else:
+        def scan(raw, _finditer=compiled.finditer):
+            return list(_finditer(raw))
+
+    if groups:
+        fields = []
+        for field_name, group_idx in groups:
+            try:
+                idx = int(group_idx)
+            except (TypeError, ValueError):
+                idx = None
+            if idx is not None and not 0 <= idx <= compiled.groups:
+                idx = None
+            fields.append((field_name, idx))
+
+        names = tuple(name for name, _ in fields)
+        idxs = tuple(idx for _, idx in fields)
+
+        if None in idxs:
+            def extract(raw, _scan=scan, _fields=tuple(fields)):
+                return [
+                    {name: (m.group(idx) if idx is not None else None)
+                     for name, idx in _fields}
+                    for m in _scan(raw)
+                ]
+        elif len(idxs) == 1:
+            def extract(raw, _scan=scan, _name=names[0], _idx=idxs[0]):
+                return [{_name: m.group(_idx)} for m in _scan(raw)]
+        else:
+            # m.group(*idxs) fetches every field in one call
+            def extract(raw, _scan=scan, _names=names, _idxs=idxs, _zip=zip):
+                return [dict(_zip(_names, m.group(*_idxs))) for m in _scan(raw)]
+
+    elif compiled.groupindex:
+        def extract(raw, _scan=scan):
+            return [m.groupdict() for m in _scan(raw)]
+
+    else:
+        names = tuple(f"field_{i}" for i in range(1, compiled.groups + 1))
+
+        def extract(raw, _scan=scan, _names=names, _zip=zip):
+            return [dict(_zip(_names, m.groups())) for m in _scan(raw)]
+
+    return extract
+
+
 def _parse_regex(raw: str, parser_config: dict) -> tuple[list[dict] | None, str]:
     """
     Parse raw CLI output using inline regex from collection config.
@@ -211,45 +434,383 @@ def _parse_regex(raw: str, parser_config: dict) -> tuple[list[dict] | None, str]
     if not pattern:
         return None, "no pattern defined"
 
-    # Build regex flags
-    flags_str = parser_config.get("flags", "")
-    flags = 0
-    for flag_name in flags_str.replace("|", ",").replace(" ", ",").split(","):
-        flag_name = flag_name.strip().upper()
-        if flag_name == "MULTILINE":
-            flags |= re.MULTILINE
-        elif flag_name == "DOTALL":
-            flags |= re.DOTALL
-        elif flag_name == "IGNORECASE":
-            flags |= re.IGNORECASE
+    group_map = parser_config.get("groups") or {}
+
+    try:
+        extract = _regex_extractor(
+            pattern, parser_config.get("flags", ""), tuple(group_map.items())
+        )
+    except re.error as e:
+        return None, f"regex compile error: {e}"
 
-    group_map = parser_config.get("groups", {})
+    results = extract(raw)
+    if not results:
+        return None, "0 matches for pattern"
+    return results, ""
 
+
+_NUMERIC_BACKREF = re.compile(r"\\[1-9]")
+
+
+@lru_cache(maxsize=256)
+def _compile_combined(specs: tuple[tuple[str, str], ...]):
+    """
+    Merge several inline regex patterns into one alternation.
+
+    specs is a tuple of (pattern, flags_str). Each pattern is wrapped in
+    a named group "_p<i>" with its flags scoped to that branch
+    ("(?m:...)"), so a single finditer() pass over the output reports
+    which configured pattern matched via m.lastgroup.
+
+    Returns (compiled, layout) where layout[i] is
+    (offset, ngroups, groupindex) — offset is the wrapper group number,
+    so the pattern's own group k lives at offset + k.
+
+    Raises re.error when patterns can't be combined (numbered
+    backreferences would shift, duplicate group names clash).
+    """
+    parts = []
+    layout = []
+    offset = 1
+    for i, (pattern, flags_str) in enumerate(specs):
+        if _NUMERIC_BACKREF.search(pattern):
+            raise re.error("numbered backreference")
+        sub = re.compile(pattern, _parse_flags(flags_str))
+        inline = "".join(c for f, c in _INLINE_FLAG_CHARS.items() if sub.flags & f)
+        parts.append(f"(?P<_p{i}>(?{inline}:{pattern}))" if inline
+                     else f"(?P<_p{i}>(?:{pattern}))")
+        layout.append((offset, sub.groups, dict(sub.groupindex)))
+        offset += sub.groups + 1
+    return re.compile("|".join(parts)), tuple(layout)
+
+
+def _parse_regex_combined(
+    raw: str,
+    parser_defs: list[dict],
+) -> tuple[int, list[dict] | None]:
+    """
+    Try several inline regex parsers with a single scan of the output.
+
+    Same outcome as trying them one by one with _parse_regex: the first
+    configured pattern that matches wins, with the same rows. The scan
+    only narrows the search:
+
+    - it takes the leftmost match from any branch, so a later pattern
+      can consume text an earlier one would have matched further right;
+      the parsers before the scan's winner are re-run on their own and
+      the first that matches wins instead.
+    - a line-anchored pattern (see _is_line_anchored) is matched one
+      line at a time by _parse_regex, but finditer() over the whole text
+      lets its \s+ run across newlines; when such a pattern wins the
+      scan, it and the parsers after it are re-run on their own.
+    - when matches from different patterns interleave, the winner is
+      re-run on its own so its rows are complete.
+
+    Returns (winner_index, rows) — (-1, None) if nothing matched.
+    Raises re.error if the patterns can't be combined.
+    """
+    specs = tuple(
+        (p.get("pattern") or "", p.get("flags", "")) for p in parser_defs
+    )
+    if not all(pattern for pattern, _ in specs):
+        raise re.error("parser without pattern")
+
+    compiled, layout = _compile_combined(specs)
+    matches = list(compiled.finditer(raw))
+    if not matches:
+        return -1, None
+
+    winner = min(int(m.lastgroup[2:]) for m in matches)
+    for i in range(winner):
+        rows, _ = _parse_regex(raw, parser_defs[i])
+        if rows:
+            return i, rows
+
+    if _is_line_anchored(*specs[winner]):
+        for i in range(winner, len(parser_defs)):
+            rows, _ = _parse_regex(raw, parser_defs[i])
+            if rows:
+                return i, rows
+        return -1, None
+
+    if any(m.lastgroup != f"_p{winner}" for m in matches):
+        rows, _ = _parse_regex(raw, parser_defs[winner])
+        return winner, rows
+
+    offset, ngroups, groupindex = layout[winner]
+    group_map = parser_defs[winner].get("groups", {})
+
+    results = []
+    for m in matches:
+        row = {}
+        if group_map:
+            for field_name, group_idx in group_map.items():
+                try:
+                    idx = int(group_idx)
+                    row[field_name] = (
+                        m.group(offset + idx) if 0 <= idx <= ngroups else None
+                    )
+                except (IndexError, ValueError):
+                    row[field_name] = None
+        elif groupindex:
+            row = {name: m.group(offset + gi) for name, gi in groupindex.items()}
+        else:
+            for i in range(1, ngroups + 1):
+                row[f"field_{i}"] = m.group(offset + i)
+        results.append(row)
+
+    return winner, results
+
+
+def _build_hyperscan_db(specs: tuple[tuple[str, str], ...]):
+    """
+    Compile (pattern, flags_str) specs into a Hyperscan prefilter database.
+
+    Patterns compile with HS_FLAG_PREFILTER, so Hyperscan may report
+    matches that re wouldn't (it approximates constructs it doesn't
+    support) but never misses one — a pattern it doesn't report
+    cannot match. Pattern ids are the spec indices.
+
+    Returns None if Hyperscan can't compile the set.
+    """
+    if not all(pattern for pattern, _ in specs):
+        return None
+
+    base = (
+        hyperscan.HS_FLAG_PREFILTER
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_ALLOWEMPTY
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+    )
+    hs_flags = []
+    for _, flags_str in specs:
+        flags = _parse_flags(flags_str)
+        f = base
+        if flags & re.MULTILINE:
+            f |= hyperscan.HS_FLAG_MULTILINE
+        if flags & re.DOTALL:
+            f |= hyperscan.HS_FLAG_DOTALL
+        if flags & re.IGNORECASE:
+            f |= hyperscan.HS_FLAG_CASELESS
+        hs_flags.append(f)
+
+    db = hyperscan.Database()
     try:
-        matches = list(re.finditer(pattern, raw, flags))
-        if not matches:
-            return None, f"0 matches for pattern"
-
-        results = []
-        for m in matches:
-            row = {}
-            if group_map:
-                for field_name, group_idx in group_map.items():
-                    try:
-                        row[field_name] = m.group(int(group_idx))
-                    except (IndexError, ValueError):
-                        row[field_name] = None
+        db.compile(
+            expressions=[pattern.encode() for pattern, _ in specs],
+            ids=list(range(len(specs))),
+            elements=len(specs),
+            flags=hs_flags,
+        )
+    except Exception as e:
+        logger.debug(f"hyperscan rejected pattern set, prefilter off: {e}")
+        return None
+    return db
+
+
+def _group_regex_runs(parsers: list[dict]) -> list[dict | list[dict]]:
+    """Collapse consecutive regex parser defs into lists for one-pass matching."""
+    steps = []
+    for parser_def in parsers:
+        if parser_def.get("type", "").lower() == "regex":
+            if steps and isinstance(steps[-1], list):
+                steps[-1].append(parser_def)
             else:
-                row = m.groupdict()
-                if not row:
-                    for i, g in enumerate(m.groups(), 1):
-                        row[f"field_{i}"] = g
-            results.append(row)
+                steps.append([parser_def])
+        else:
+            steps.append(parser_def)
+    return steps
 
-        return results if results else None, "" if results else "no groups captured"
 
-    except re.error as e:
-        return None, f"regex compile error: {e}"
+def _parse_columns(raw: str, parser_config: dict) -> tuple[list[dict] | None, str]:
+    """
+    Parse whitespace-delimited tabular CLI output with str.split().
+
+    Fixed-column tables (show ip int brief, show ip bgp summary) don't
+    need a regex engine — splitting on whitespace and zipping with the
+    column names is several times cheaper and allocates no Match objects.
+
+    Config keys:
+        columns:           field names in column order; null skips a column
+        header:            data starts after the first line beginning with this
+        skip_header_lines: non-blank lines to skip before data (default 0)
+        merge_column:      column that absorbs extra tokens when a row has
+                           more tokens than columns ("administratively down");
+                           defaults to the last column
+
+    Lines with fewer tokens than columns are not data rows and are skipped.
+
+    Returns (rows, error_reason).
+    """
+    columns = parser_config.get("columns")
+    if not columns:
+        return None, "no columns defined"
+
+    ncols = len(columns)
+    merge_at = ncols - 1
+    merge_column = parser_config.get("merge_column")
+    if merge_column is not None:
+        if merge_column not in columns:
+            return None, f"merge_column '{merge_column}' not in columns"
+        merge_at = columns.index(merge_column)
+
+    lines = raw.splitlines()
+    header = parser_config.get("header")
+    if header:
+        for i, line in enumerate(lines):
+            if line.lstrip().startswith(header):
+                lines = lines[i + 1:]
+                break
+        else:
+            return None, f"header '{header}' not found"
+
+    skip = int(parser_config.get("skip_header_lines", 0))
+
+    results = []
+    for line in lines:
+        parts = line.split()
+        if not parts:
+            continue
+        if skip:
+            skip -= 1
+            continue
+        if len(parts) < ncols:
+            continue
+
+        extra = len(parts) - ncols
+        if extra:
+            end = merge_at + extra + 1
+            parts[merge_at:end] = [" ".join(parts[merge_at:end])]
+
+        results.append({
+            name: value for name, value in zip(columns, parts)
+            if name is not None
+        })
+
+    return results if results else None, "" if results else "0 data rows"
+
+
+_WS_TABLE_CASTS = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "percent": lambda v: float(v.rstrip("%")),
+}
+
+
+def _parse_ws_table(raw: str, parser_config: dict) -> tuple[list[dict] | None, str]:
+    """
+    Parse a whitespace table that follows a header line, casting inline.
+
+    Built for process tables (show processes cpu) where the last column
+    is free text with spaces ("Chunk Manager"): each line is split into
+    at most len(columns) fields, so the last column keeps the remainder.
+
+    Config keys:
+        header_regex: data starts on the line after the first match
+        columns:      list of names or [name, type] pairs — type is one of
+                      str, int, float, percent ("0.07%" → 0.07); null
+                      names skip a column. Values that fail to cast are
+                      kept as strings.
+
+    Returns (rows, error_reason).
+    """
+    columns = parser_config.get("columns")
+    if not columns:
+        return None, "no columns defined"
+
+    specs = []
+    for col in columns:
+        if isinstance(col, (list, tuple)):
+            name = col[0]
+            cast = _WS_TABLE_CASTS.get(col[1]) if len(col) > 1 else None
+        else:
+            name, cast = col, None
+        specs.append((name, cast))
+    ncols = len(specs)
+
+    header_regex = parser_config.get("header_regex")
+    if header_regex:
+        try:
+            m = _compile_pattern(header_regex, "MULTILINE").search(raw)
+        except re.error as e:
+            return None, f"header_regex compile error: {e}"
+        if not m:
+            return None, "header not found"
+        nl = raw.find("\n", m.end())
+        raw = raw[nl + 1:] if nl >= 0 else ""
+
+    results = []
+    for line in raw.splitlines():
+        parts = line.split(None, ncols - 1)
+        if len(parts) < ncols:
+            continue
+        row = {}
+        for (name, cast), value in zip(specs, parts):
+            if name is None:
+                continue
+            if cast is not None:
+                try:
+                    value = cast(value)
+                except ValueError:
+                    pass
+            row[name] = value
+        results.append(row)
+
+    return results if results else None, "" if results else "0 data rows"
+
+
+# ── Built-in fast parsers ──────────────────────────────────────────
+
+_INTF_STATES = frozenset({"up", "down"})
+
+
+def parse_ip_interface_brief(raw: str) -> list[dict] | None:
+    """
+    Parse 'show ip interface brief' with str.split() — no regex engine.
+
+    Columns: Interface, IP-Address, OK?, Method, Status, Protocol.
+    Status is the only column that can hold a space
+    ("administratively down"), so rows are 6 or 7 tokens.
+
+    Returns rows keyed intf / ipaddr / status / proto (the same names
+    the regex fallback captures), or None if nothing looked like a row.
+    """
+    rows = []
+    for line in raw.splitlines():
+        parts = line.split()
+        n = len(parts)
+        if n == 6:
+            status = parts[4]
+        elif n == 7 and parts[4] == "administratively":
+            status = f"administratively {parts[5]}"
+        else:
+            continue
+
+        proto = parts[-1]
+        if (proto not in _INTF_STATES
+                or status.rpartition(" ")[2] not in _INTF_STATES):
+            continue
+
+        ipaddr = parts[1]
+        if ipaddr != "unassigned" and not ipaddr.replace(".", "").isdigit():
+            continue
+
+        rows.append({
+            "intf": parts[0],
+            "ipaddr": ipaddr,
+            "status": status,
+            "proto": proto,
+        })
+
+    return rows or None
+
+
+# command → parser tried before the configured chain
+_FAST_PARSERS = {
+    "show ip interface brief": parse_ip_interface_brief,
+}
 
 
 # ── Normalizer ─────────────────────────────────────────────────────
@@ -449,7 +1010,7 @@ class TemplateResolver:
 
 class ParserChain:
     """
-    Ordered parser chain: TextFSM → TTP → Regex fallback.
+    Ordered parser chain: TextFSM → TTP → Columns → Regex fallback.
 
     The chain iterates through parsers defined in a collection config.
     First parser that returns structured data wins. Metadata about
@@ -458,25 +1019,32 @@ class ParserChain:
 
     def __init__(self, template_search_paths: list[str | Path] = None):
         self._resolver = TemplateResolver(template_search_paths)
+        # Hyperscan databases keyed by (pattern, flags) specs. Per
+        # instance, not module-level: a database's scratch space can't
+        # be shared between concurrent scans, and each PollEngine
+        # thread owns its own chain.
+        self._hs_databases: dict[tuple, Any] = {}
 
     def parse(
         self,
-        raw_output: str,
+        raw_output: str | bytes,
         collection_config: dict,
         schema: dict | None = None,
         trace: "ParseTrace" = None,
-    ) -> tuple[list[dict], dict]:
+    ) -> tuple[list[dict], Mapping[str, str]]:
         """
         Parse raw CLI output using the parser chain.
 
         Args:
-            raw_output:        Raw text from the device
+            raw_output:        Raw text from the device (str, or bytes as read
+                               off the channel — decoded once as UTF-8)
             collection_config: Collection YAML config with 'parsers' list
             schema:            Optional canonical schema for type coercion
             trace:             Optional ParseTrace for audit logging
 
         Returns:
-            (parsed_rows, metadata)
+            (parsed_rows, metadata) — metadata may be shared; treat it
+            as read-only.
         """
         parsers = collection_config.get("parsers", [])
         normalize_map = collection_config.get("normalize")
@@ -484,12 +1052,40 @@ class ParserChain:
         errors = []
 
         if not raw_output or not raw_output.strip():
-            return [], _meta("none", error="empty output")
+            return [], _META_EMPTY_OUTPUT
+
+        if isinstance(raw_output, bytes):
+            raw_output = raw_output.decode("utf-8", errors="replace")
 
         # Sanitize: strip command echo and prompt
         cleaned = _sanitize_cli_output(raw_output, command, trace=trace)
 
-        for parser_def in parsers:
+        fast_parser = _FAST_PARSERS.get(command) if command else None
+        if fast_parser and collection_config.get("fast_path", True):
+            result = fast_parser(cleaned)
+            if trace:
+                trace.parser_tried(
+                    "builtin", fast_parser.__name__,
+                    success=result is not None,
+                    reason="" if result else "0 rows",
+                    rows=len(result) if result else 0,
+                    fields=list(result[0].keys()) if result else [],
+                )
+            if result:
+                result = _normalize(result, normalize_map, trace=trace)
+                result = _coerce_types(result, schema, trace=trace)
+                return result, _meta("builtin", fast_parser.__name__)
+            errors.append("builtin: 0 rows")
+
+        for parser_def in _group_regex_runs(parsers):
+            if isinstance(parser_def, list):
+                result = self._try_regex(cleaned, parser_def, errors, trace=trace)
+                if result:
+                    result = _normalize(result, normalize_map, trace=trace)
+                    result = _coerce_types(result, schema, trace=trace)
+                    return result, _meta("regex")
+                continue
+
             ptype = parser_def.get("type", "").lower()
 
             if ptype == "textfsm":
@@ -512,11 +1108,11 @@ class ParserChain:
                     return result, _meta("ttp", template_name)
                 errors.append(f"ttp: no match")
 
-            elif ptype == "regex":
-                result, reason = _parse_regex(cleaned, parser_def)
+            elif ptype == "columns":
+                result, reason = _parse_columns(cleaned, parser_def)
                 if trace:
                     trace.parser_tried(
-                        "regex", "inline",
+                        "columns", "inline",
                         success=result is not None,
                         reason=reason,
                         rows=len(result) if result else 0,
@@ -525,14 +1121,121 @@ class ParserChain:
                 if result:
                     result = _normalize(result, normalize_map, trace=trace)
                     result = _coerce_types(result, schema, trace=trace)
-                    return result, _meta("regex")
-                errors.append(f"regex: {reason}")
+                    return result, _meta("columns")
+                errors.append(f"columns: {reason}")
+
+            elif ptype == "ws_table":
+                result, reason = _parse_ws_table(cleaned, parser_def)
+                if trace:
+                    trace.parser_tried(
+                        "ws_table", "inline",
+                        success=result is not None,
+                        reason=reason,
+                        rows=len(result) if result else 0,
+                        fields=list(result[0].keys()) if result else [],
+                    )
+                if result:
+                    result = _normalize(result, normalize_map, trace=trace)
+                    result = _coerce_types(result, schema, trace=trace)
+                    return result, _meta("ws_table")
+                errors.append(f"ws_table: {reason}")
 
             else:
                 errors.append(f"unknown parser type: {ptype}")
 
-        error_detail = "; ".join(errors) if errors else "no parsers defined"
-        return [], _meta("none", error=f"all parsers failed ({error_detail})")
+        if not errors:
+            return [], _META_NO_PARSERS
+        return [], _meta("none", error=f"all parsers failed ({'; '.join(errors)})")
+
+    def _try_regex(
+        self,
+        raw: str,
+        parser_defs: list[dict],
+        errors: list[str],
+        trace: "ParseTrace" = None,
+    ) -> list[dict] | None:
+        """
+        Try a run of consecutive inline regex parsers. Return rows or None.
+
+        With Hyperscan installed, one scan of the output prefilters the
+        whole run and only patterns that can match are handed to
+        _parse_regex, in configured order.
+
+        Otherwise a single parser goes straight to _parse_regex, and
+        several parsers are matched in one pass via a combined
+        alternation; if they can't be combined (bad pattern, clashing
+        group names, numbered backreferences) each is tried on its own.
+        """
+        candidates = self._prefilter(raw, parser_defs) if _HAS_HYPERSCAN else None
+
+        if candidates is None and len(parser_defs) > 1:
+            try:
+                winner, result = _parse_regex_combined(raw, parser_defs)
+            except re.error:
+                pass
+            else:
+                tried = parser_defs if winner < 0 else parser_defs[:winner + 1]
+                for i, parser_def in enumerate(tried):
+                    success = i == winner and bool(result)
+                    reason = "" if success else "0 matches for pattern"
+                    if trace:
+                        trace.parser_tried(
+                            "regex", "inline",
+                            success=success,
+                            reason=reason,
+                            rows=len(result) if success else 0,
+                            fields=list(result[0].keys()) if success else [],
+                        )
+                    if not success:
+                        errors.append(f"regex: {reason}")
+                return result or None
+
+        for i, parser_def in enumerate(parser_defs):
+            if candidates is not None and i not in candidates:
+                result, reason = None, "0 matches for pattern (prefilter)"
+            else:
+                result, reason = _parse_regex(raw, parser_def)
+            if trace:
+                trace.parser_tried(
+                    "regex", "inline",
+                    success=result is not None,
+                    reason=reason,
+                    rows=len(result) if result else 0,
+                    fields=list(result[0].keys()) if result else [],
+                )
+            if result:
+                return result
+            errors.append(f"regex: {reason}")
+
+        return None
+
+    def _prefilter(self, raw: str, parser_defs: list[dict]) -> set[int] | None:
+        """
+        Indices of parser_defs whose pattern may match raw.
+
+        Returns None when no prefilter database is available for this
+        set of patterns (caller falls back to trying them with re).
+        """
+        specs = tuple(
+            (p.get("pattern") or "", p.get("flags", "")) for p in parser_defs
+        )
+        if specs not in self._hs_databases:
+            self._hs_databases[specs] = _build_hyperscan_db(specs)
+        db = self._hs_databases[specs]
+        if db is None:
+            return None
+
+        hits = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(pattern_id)
+
+        try:
+            db.scan(raw.encode("utf-8", errors="replace"), match_event_handler=on_match)
+        except Exception as e:
+            logger.debug(f"hyperscan scan failed, prefilter off: {e}")
+            return None
+        return hits
 
     def _try_textfsm(
         self,
@@ -619,6 +1322,56 @@ class ParserChain:
 
         return None, ""
 
+    def precompile(self, collection_configs: list[dict]) -> int:
+        """
+        Compile every inline pattern in the given collection configs.
+
+        Fills the module-level pattern caches up front so the first poll
+        cycle doesn't pay compilation cost. Bad patterns are skipped —
+        they'll report their error when parse() reaches them.
+
+        Returns the number of patterns compiled.
+        """
+        compiled = 0
+        for config in collection_configs:
+            if not config:
+                continue
+            for step in _group_regex_runs(config.get("parsers", [])):
+                if isinstance(step, list):
+                    for parser_def in step:
+                        pattern = parser_def.get("pattern")
+                        if not pattern:
+                            continue
+                        flags_str = parser_def.get("flags", "")
+                        groups = parser_def.get("groups") or {}
+                        try:
+                            _regex_extractor(
+                                pattern, flags_str, tuple(groups.items())
+                            )
+                            compiled += 1
+                        except re.error as e:
+                            logger.debug(f"precompile skipped pattern: {e}")
+                    specs = tuple(
+                        (p.get("pattern") or "", p.get("flags", ""))
+                        for p in step
+                    )
+                    if _HAS_HYPERSCAN and specs not in self._hs_databases:
+                        self._hs_databases[specs] = _build_hyperscan_db(specs)
+                    if len(step) > 1:
+                        try:
+                            _compile_combined(specs)
+                        except re.error:
+                            pass
+                elif step.get("type", "").lower() == "ws_table":
+                    header_regex = step.get("header_regex")
+                    if header_regex:
+                        try:
+                            _compile_pattern(header_regex, "MULTILINE")
+                            compiled += 1
+                        except re.error as e:
+                            logger.debug(f"precompile skipped header: {e}")
+        return compiled
+
     @property
     def has_textfsm(self) -> bool:
         return _HAS_TEXTFSM
@@ -633,7 +1386,11 @@ class ParserChain:
         return {
             "textfsm": _HAS_TEXTFSM,
             "ttp": _HAS_TTP,
+            "columns": True,
+            "ws_table": True,
             "regex": True,
+            "hyperscan": _HAS_HYPERSCAN,
+            "builtin": sorted(_FAST_PARSERS),
             "ntc_templates": self._resolver._ntc_path is not None,
             "ntc_templates_path": str(self._resolver._ntc_path)
                                   if self._resolver._ntc_path else None,
@@ -739,13 +1496,13 @@ class CollectionLoader:
 # ── Convenience ────────────────────────────────────────────────────
 
 def parse_collection(
-    raw_output: str,
+    raw_output: str | bytes,
     collection: str,
     vendor: str,
     parser_chain: ParserChain,
     collection_loader: CollectionLoader,
     trace: "ParseTrace" = None,
-) -> tuple[list[dict], dict]:
+) -> tuple[list[dict], Mapping[str, str]]:
     """
     High-level: parse raw output for a specific collection and vendor.
     """
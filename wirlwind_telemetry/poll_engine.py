@@ -131,6 +131,13 @@ class PollEngine(QThread):
                 f"Check collections/ directory has {vendor}.yaml configs."
             )
 
+        # Compile inline patterns now rather than on the first poll
+        compiled = self._parser_chain.precompile([
+            self._collection_loader.get_config(c, vendor)
+            for c in self.collections
+        ])
+        logger.debug(f"Precompiled {compiled} inline patterns")
+
         # ── Parse trace store ────────────────────────────────────
         self._trace_store = ParseTraceStore(max_per_collection=20)
 